@@ -13,13 +13,18 @@ Features:
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import time
 import os
-import sys
+import ast
+import importlib.util
 import json
+import mmap
+import csv
+import re
+import zlib
+import threading
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 import traceback
@@ -33,6 +38,81 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     st.warning("⚠️ psutil not installed. Using basic system monitoring. Install with: pip install psutil")
 
+# Client-side auto-refresh, falling back to a blocking sleep + rerun
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False
+
+# No spinner: this runs at import, before set_page_config, and a spinner
+# element would make set_page_config raise
+@st.cache_resource(show_spinner=False)
+def get_process_handle():
+    """Process handle shared across reruns, with cpu_percent counters primed"""
+    process = psutil.Process()
+    # cpu_percent(interval=None) measures against the previous call
+    psutil.cpu_percent(interval=None)
+    process.cpu_percent(interval=None)
+    return process
+
+_PROC = get_process_handle() if PSUTIL_AVAILABLE else None
+
+IS_WINDOWS = platform.system() == 'Windows'
+
+VIDEOS_CSV_PATH = Path("backend/data/videos/youtube_videos.csv")
+COMMENTS_CSV_PATH = Path("backend/data/comments/youtube_comments.csv")
+LOGO_PATH = Path("assets/images/percepta_logo.png")
+DASHBOARD_PATH = Path("reputation_dashboard.py")
+DATA_FILE_PATHS = (VIDEOS_CSV_PATH, COMMENTS_CSV_PATH, LOGO_PATH, DASHBOARD_PATH)
+VALIDATION_CACHE_TTL = 60
+SIGNATURE_BLOCK_BYTES = 4096
+LOG_DIRS = ("logs", "scripts/logs")
+LOG_LIST_CACHE_TTL = 5
+LOG_TAIL_DEFAULT_KB = 256
+
+# (warning, error) upper bounds per metric - above a bound moves up a tier
+HEALTH_TIERS = ("healthy", "warning", "error")
+HEALTH_THRESHOLDS = {
+    'cpu_percent': (60, 80),
+    'memory_percent': (70, 85),
+    'disk_percent': (80, 90),
+    'process_memory_mb': (500, 1000)
+}
+
+DISK_USAGE_CACHE_TTL = 30
+
+METRICS_HISTORY_SIZE = 50
+METRICS_SAMPLE_SECONDS = 1.0
+
+def _sampler_loop(buffer):
+    """Append a CPU/memory sample to the buffer every sample interval"""
+    while True:
+        try:
+            cpu = psutil.cpu_percent(interval=METRICS_SAMPLE_SECONDS)
+            memory = psutil.virtual_memory()
+            buffer.append({
+                'timestamp': datetime.now(),
+                'cpu': cpu,
+                'memory': memory.percent
+            })
+        except Exception:
+            time.sleep(METRICS_SAMPLE_SECONDS)
+
+@st.cache_resource
+def get_metrics_buffer():
+    """Start the background sampler once per server and return its ring buffer"""
+    buffer = deque(maxlen=METRICS_HISTORY_SIZE)
+    if PSUTIL_AVAILABLE:
+        sampler = threading.Thread(
+            target=_sampler_loop,
+            args=(buffer,),
+            name="debug-metrics-sampler",
+            daemon=True
+        )
+        sampler.start()
+    return buffer
+
 # 🎨 DEBUG THEME CONFIGURATION
 st.set_page_config(
     page_title="Percepta Pro - Debug Console",
@@ -41,93 +121,110 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+_DEBUG_CSS = """
+<style>
+/* Import Professional Fonts */
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+
+/* Debug Theme Variables */
+:root {
+    --debug-primary: #10B981;
+    --debug-warning: #F59E0B;
+    --debug-error: #EF4444;
+    --debug-info: #3B82F6;
+    --bg-main: #0F172A;
+    --bg-card: #1E293B;
+    --bg-interactive: #334155;
+    --text-primary: #F8FAFC;
+    --text-secondary: #CBD5E1;
+    --text-muted: #64748B;
+    --border-color: #475569;
+}
+
+/* Main App Background */
+.stApp {
+    background: linear-gradient(135deg, var(--bg-main) 0%, #1E1E2E 100%);
+    font-family: 'Inter', sans-serif;
+}
+
+/* Sidebar Styling */
+.css-1d391kg, .stSidebar > div {
+    background: linear-gradient(180deg, var(--bg-card) 0%, #2A2A3A 100%);
+    border-right: 2px solid var(--border-color);
+}
+
+/* Debug Card Styling */
+.debug-card {
+    background: linear-gradient(135deg, var(--bg-card) 0%, #252535 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border: 1px solid var(--border-color);
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+    margin-bottom: 1rem;
+    transition: all 0.3s ease;
+}
+
+.debug-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px rgba(16, 185, 129, 0.15);
+    border-color: var(--debug-primary);
+}
+
+/* Status Indicators */
+.status-healthy { color: var(--debug-primary); }
+.status-warning { color: var(--debug-warning); }
+.status-error { color: var(--debug-error); }
+.status-info { color: var(--debug-info); }
+
+/* Code blocks */
+.debug-code {
+    background: #1a1a1a;
+    border: 1px solid #333;
+    border-radius: 6px;
+    padding: 1rem;
+    font-family: 'Courier New', monospace;
+    font-size: 0.85rem;
+    color: #f8f8f2;
+    margin: 0.5rem 0;
+}
+
+/* Hide Streamlit Branding */
+#MainMenu {visibility: hidden;}
+.stDeployButton {display:none;}
+footer {visibility: hidden;}
+</style>
+"""
+
+@st.cache_resource
+def get_debug_css():
+    """Debug stylesheet with comments and whitespace stripped, built once"""
+    css = re.sub(r'/\*.*?\*/', '', _DEBUG_CSS, flags=re.DOTALL)
+    return re.sub(r'\s+', ' ', css).strip()
+
 def load_debug_css():
-    st.markdown("""
-    <style>
-    /* Import Professional Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Debug Theme Variables */
-    :root {
-        --debug-primary: #10B981;
-        --debug-warning: #F59E0B;
-        --debug-error: #EF4444;
-        --debug-info: #3B82F6;
-        --bg-main: #0F172A;
-        --bg-card: #1E293B;
-        --bg-interactive: #334155;
-        --text-primary: #F8FAFC;
-        --text-secondary: #CBD5E1;
-        --text-muted: #64748B;
-        --border-color: #475569;
-    }
-    
-    /* Main App Background */
-    .stApp {
-        background: linear-gradient(135deg, var(--bg-main) 0%, #1E1E2E 100%);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Sidebar Styling */
-    .css-1d391kg, .stSidebar > div {
-        background: linear-gradient(180deg, var(--bg-card) 0%, #2A2A3A 100%);
-        border-right: 2px solid var(--border-color);
-    }
-    
-    /* Debug Card Styling */
-    .debug-card {
-        background: linear-gradient(135deg, var(--bg-card) 0%, #252535 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 1px solid var(--border-color);
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        margin-bottom: 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .debug-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(16, 185, 129, 0.15);
-        border-color: var(--debug-primary);
-    }
-    
-    /* Status Indicators */
-    .status-healthy { color: var(--debug-primary); }
-    .status-warning { color: var(--debug-warning); }
-    .status-error { color: var(--debug-error); }
-    .status-info { color: var(--debug-info); }
-    
-    /* Code blocks */
-    .debug-code {
-        background: #1a1a1a;
-        border: 1px solid #333;
-        border-radius: 6px;
-        padding: 1rem;
-        font-family: 'Courier New', monospace;
-        font-size: 0.85rem;
-        color: #f8f8f2;
-        margin: 0.5rem 0;
-    }
-    
-    /* Hide Streamlit Branding */
-    #MainMenu {visibility: hidden;}
-    .stDeployButton {display:none;}
-    footer {visibility: hidden;}
-    </style>
-    """, unsafe_allow_html=True)
+    # Emitted on every rerun - Streamlit drops elements a rerun does not re-send
+    st.markdown(get_debug_css(), unsafe_allow_html=True)
+
+@st.cache_resource(ttl=DISK_USAGE_CACHE_TTL)
+def get_disk_usage():
+    """Disk usage for the drive holding the working directory, refreshed every 30s"""
+    return psutil.disk_usage(os.getcwd())
 
 def get_system_health():
     """Get comprehensive system health metrics with fallbacks"""
     try:
         if PSUTIL_AVAILABLE:
             # Full system monitoring with psutil
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: returns usage since the previous call
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            disk = get_disk_usage()
             
-            # Process info
-            process = psutil.Process()
-            process_memory = process.memory_info().rss / 1024 / 1024  # MB
+            # Process info - oneshot() batches the underlying /proc reads
+            with _PROC.oneshot():
+                process_memory = _PROC.memory_info().rss / 1024 / 1024  # MB
+                process_cpu = _PROC.cpu_percent(interval=None)
+                process_threads = _PROC.num_threads()
             
             return {
                 'cpu_percent': cpu_percent,
@@ -136,6 +233,8 @@ def get_system_health():
                 'disk_percent': disk.percent,
                 'disk_free_gb': disk.free / 1024 / 1024 / 1024,
                 'process_memory_mb': process_memory,
+                'process_cpu_percent': process_cpu,
+                'process_threads': process_threads,
                 'timestamp': datetime.now(),
                 'method': 'psutil'
             }
@@ -147,7 +246,7 @@ def get_system_health():
             # Get basic system info
             try:
                 # Try to get disk space on Windows
-                if platform.system() == 'Windows':
+                if IS_WINDOWS:
                     import shutil
                     total, used, free = shutil.disk_usage('.')
                     disk_percent = (used / total) * 100
@@ -172,67 +271,115 @@ def get_system_health():
     except Exception as e:
         return {'error': str(e)}
 
-def validate_data_files():
-    """Validate core data files and structure"""
-    validation_results = []
-    
-    # Check video data
-    videos_path = Path("backend/data/videos/youtube_videos.csv")
-    if videos_path.exists():
-        try:
-            videos_df = pd.read_csv(videos_path)
-            validation_results.append({
-                'file': 'Videos Dataset',
-                'status': 'healthy',
-                'records': len(videos_df),
-                'columns': list(videos_df.columns),
-                'message': f'✅ {len(videos_df)} videos loaded successfully'
-            })
-        except Exception as e:
-            validation_results.append({
-                'file': 'Videos Dataset',
-                'status': 'error',
-                'message': f'❌ Error loading videos: {str(e)}'
-            })
-    else:
-        validation_results.append({
-            'file': 'Videos Dataset',
+def read_csv_header(path):
+    """Column names from the first CSV record"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f), [])
+
+def scan_csv(path):
+    """Return (row_count, columns) for a CSV without building a DataFrame"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        # csv.reader keeps quoted multi-line comment text as one record
+        row_count = sum(1 for _ in reader)
+    return row_count, columns
+
+def stat_or_none(path):
+    """Single os.stat call; None signals the file is missing"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def file_mtime(path):
+    """Modification time used as a cache key, or None if the file is missing"""
+    file_stat = stat_or_none(path)
+    return file_stat.st_mtime if file_stat else None
+
+def file_signature(path, file_stat):
+    """Cheap integrity signature: size, mtime and a CRC of the first block"""
+    with open(path, 'rb') as f:
+        head_crc = zlib.crc32(f.read(SIGNATURE_BLOCK_BYTES))
+    return (str(path), file_stat.st_size, file_stat.st_mtime_ns, head_crc)
+
+@st.cache_resource
+def get_record_count_store():
+    """Record counts keyed by file signature, shared across reruns"""
+    return {}
+
+def _count_records(path, signature, store):
+    """Background job: full record count for one signature"""
+    try:
+        store[signature] = scan_csv(path)[0]
+    except Exception as e:
+        # Kept, not dropped: the file is reported as broken and is not rescanned
+        # until its signature changes
+        store[signature] = e
+
+def get_record_count(path, signature):
+    """Record count for this signature, None while a recount runs, or the scan's exception"""
+    store = get_record_count_store()
+    if signature not in store:
+        store[signature] = None
+        threading.Thread(
+            target=_count_records,
+            args=(path, signature, store),
+            daemon=True
+        ).start()
+    return store[signature]
+
+def validate_csv_file(path, label, noun):
+    """Validation result for one CSV dataset"""
+    file_stat = stat_or_none(path)
+    if file_stat is None:
+        return {
+            'file': label,
             'status': 'error',
-            'message': '❌ Videos file not found'
-        })
+            'message': f'❌ {noun.capitalize()} file not found'
+        }
     
-    # Check comments data
-    comments_path = Path("backend/data/comments/youtube_comments.csv")
-    if comments_path.exists():
-        try:
-            comments_df = pd.read_csv(comments_path)
-            validation_results.append({
-                'file': 'Comments Dataset',
-                'status': 'healthy',
-                'records': len(comments_df),
-                'columns': list(comments_df.columns),
-                'message': f'✅ {len(comments_df)} comments loaded successfully'
-            })
-        except Exception as e:
-            validation_results.append({
-                'file': 'Comments Dataset',
+    try:
+        columns = read_csv_header(path)
+        record_count = get_record_count(path, file_signature(path, file_stat))
+        if isinstance(record_count, Exception):
+            return {
+                'file': label,
                 'status': 'error',
-                'message': f'❌ Error loading comments: {str(e)}'
-            })
-    else:
-        validation_results.append({
-            'file': 'Comments Dataset',
+                'message': f'❌ Error loading {noun}: {str(record_count)}'
+            }
+        if record_count is None:
+            message = f'✅ {noun.capitalize()} header OK - counting records in background'
+        else:
+            message = f'✅ {record_count} {noun} loaded successfully'
+        return {
+            'file': label,
+            'status': 'healthy',
+            'records': record_count,
+            'columns': columns,
+            'message': message
+        }
+    except Exception as e:
+        return {
+            'file': label,
             'status': 'error',
-            'message': '❌ Comments file not found'
-        })
+            'message': f'❌ Error loading {noun}: {str(e)}'
+        }
+
+def validate_data_files():
+    """Validate core data files and structure"""
+    validation_results = [
+        validate_csv_file(VIDEOS_CSV_PATH, 'Videos Dataset', 'videos'),
+        validate_csv_file(COMMENTS_CSV_PATH, 'Comments Dataset', 'comments')
+    ]
     
     # Check logo
-    logo_path = Path("assets/images/percepta_logo.png")
-    if logo_path.exists():
+    logo_stat = stat_or_none(LOGO_PATH)
+    if logo_stat:
         validation_results.append({
             'file': 'Logo Asset',
             'status': 'healthy',
-            'message': f'✅ Logo found ({logo_path.stat().st_size // 1024} KB)'
+            'message': f'✅ Logo found ({logo_stat.st_size // 1024} KB)'
         })
     else:
         validation_results.append({
@@ -245,46 +392,54 @@ def validate_data_files():
 
 def test_navigation_functions():
     """Test availability of navigation functions"""
+    return _test_navigation_functions_cached(file_mtime(DASHBOARD_PATH))
+
+@st.cache_data(ttl=VALIDATION_CACHE_TTL)
+def _test_navigation_functions_cached(dashboard_mtime):
+    """Navigation test results, recomputed only when the dashboard file changes"""
     navigation_tests = []
     
-    # Import main dashboard module
+    # Test function existence
+    functions_to_test = [
+        'load_reputation_data',
+        'calculate_reputation_score',
+        'get_sentiment_distribution',
+        'create_sentiment_timeline',
+        'create_video_impact_chart',
+        'create_wordcloud_analysis'
+    ]
+    
+    # Locate and parse reputation_dashboard without executing it
     try:
-        sys.path.append('.')
-        
-        # Test function existence
-        functions_to_test = [
-            'load_reputation_data',
-            'calculate_reputation_score',
-            'get_sentiment_distribution',
-            'create_sentiment_timeline',
-            'create_video_impact_chart',
-            'create_wordcloud_analysis'
-        ]
-        
-        # Try importing reputation_dashboard
-        try:
-            import reputation_dashboard as rd
-            
-            for func_name in functions_to_test:
-                if hasattr(rd, func_name):
-                    navigation_tests.append({
-                        'function': func_name,
-                        'status': 'healthy',
-                        'message': f'✅ Function {func_name} available'
-                    })
-                else:
-                    navigation_tests.append({
-                        'function': func_name,
-                        'status': 'error',
-                        'message': f'❌ Function {func_name} not found'
-                    })
-                    
-        except ImportError as e:
+        spec = importlib.util.find_spec('reputation_dashboard')
+        if spec is None or spec.origin is None:
             navigation_tests.append({
                 'function': 'reputation_dashboard',
                 'status': 'error',
-                'message': f'❌ Cannot import reputation_dashboard: {str(e)}'
+                'message': '❌ Cannot import reputation_dashboard: module not found'
             })
+            return navigation_tests
+        
+        with open(spec.origin, 'r', encoding='utf-8') as f:
+            module_tree = ast.parse(f.read(), filename=spec.origin)
+        defined_functions = {
+            node.name for node in module_tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        
+        for func_name in functions_to_test:
+            if func_name in defined_functions:
+                navigation_tests.append({
+                    'function': func_name,
+                    'status': 'healthy',
+                    'message': f'✅ Function {func_name} available'
+                })
+            else:
+                navigation_tests.append({
+                    'function': func_name,
+                    'status': 'error',
+                    'message': f'❌ Function {func_name} not found'
+                })
             
     except Exception as e:
         navigation_tests.append({
@@ -295,6 +450,10 @@ def test_navigation_functions():
     
     return navigation_tests
 
+def health_tier(value, thresholds):
+    """Map a metric to its status tier; values above a threshold move up a tier"""
+    return HEALTH_TIERS[bisect_left(thresholds, value)]
+
 def show_system_dashboard():
     """System health and performance dashboard"""
     st.markdown('# 🔧 System Health Dashboard')
@@ -308,86 +467,64 @@ def show_system_dashboard():
     health_data = get_system_health()
     
     if 'error' not in health_data:
-        # System metrics cards
-        col1, col2, col3, col4 = st.columns(4)
-        
+        # System metrics cards - rendered as one grid in a single markdown call
         method_info = "✨ Full monitoring" if health_data['method'] == 'psutil' else "📊 Basic monitoring"
         
-        with col1:
-            cpu_color = "error" if health_data['cpu_percent'] > 80 else "warning" if health_data['cpu_percent'] > 60 else "healthy"
-            st.markdown(f"""
-            <div class="debug-card">
-                <div class="status-{cpu_color}" style="font-size: 1.5rem; margin-bottom: 0.5rem;">🖥️ CPU Usage</div>
-                <div style="color: white; font-size: 2rem; font-weight: bold;">{health_data['cpu_percent']:.1f}%</div>
-                <div style="color: #999; font-size: 0.8rem;">Processor load</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            memory_color = "error" if health_data['memory_percent'] > 85 else "warning" if health_data['memory_percent'] > 70 else "healthy"
-            st.markdown(f"""
-            <div class="debug-card">
-                <div class="status-{memory_color}" style="font-size: 1.5rem; margin-bottom: 0.5rem;">🧠 Memory</div>
-                <div style="color: white; font-size: 2rem; font-weight: bold;">{health_data['memory_percent']:.1f}%</div>
-                <div style="color: #999; font-size: 0.8rem;">{health_data['memory_available_gb']:.1f} GB available</div>
-            </div>
-            """, unsafe_allow_html=True)
+        cpu_color = health_tier(health_data['cpu_percent'], HEALTH_THRESHOLDS['cpu_percent'])
+        memory_color = health_tier(health_data['memory_percent'], HEALTH_THRESHOLDS['memory_percent'])
+        disk_color = health_tier(health_data['disk_percent'], HEALTH_THRESHOLDS['disk_percent'])
+        process_color = health_tier(health_data['process_memory_mb'], HEALTH_THRESHOLDS['process_memory_mb'])
         
-        with col3:
-            disk_color = "error" if health_data['disk_percent'] > 90 else "warning" if health_data['disk_percent'] > 80 else "healthy"
-            st.markdown(f"""
-            <div class="debug-card">
-                <div class="status-{disk_color}" style="font-size: 1.5rem; margin-bottom: 0.5rem;">💾 Disk</div>
-                <div style="color: white; font-size: 2rem; font-weight: bold;">{health_data['disk_percent']:.1f}%</div>
-                <div style="color: #999; font-size: 0.8rem;">{health_data['disk_free_gb']:.1f} GB free</div>
-            </div>
-            """, unsafe_allow_html=True)
+        metric_cards = [
+            (cpu_color, "🖥️ CPU Usage", f"{health_data['cpu_percent']:.1f}%", "Processor load"),
+            (memory_color, "🧠 Memory", f"{health_data['memory_percent']:.1f}%", f"{health_data['memory_available_gb']:.1f} GB available"),
+            (disk_color, "💾 Disk", f"{health_data['disk_percent']:.1f}%", f"{health_data['disk_free_gb']:.1f} GB free"),
+            (process_color, "⚡ Process", f"{health_data['process_memory_mb']:.0f} MB", method_info)
+        ]
         
-        with col4:
-            process_color = "error" if health_data['process_memory_mb'] > 1000 else "warning" if health_data['process_memory_mb'] > 500 else "healthy"
-            st.markdown(f"""
+        # No blank lines inside the grid, so markdown keeps it as one HTML block
+        cards_html = "".join(
+            f"""
             <div class="debug-card">
-                <div class="status-{process_color}" style="font-size: 1.5rem; margin-bottom: 0.5rem;">⚡ Process</div>
-                <div style="color: white; font-size: 2rem; font-weight: bold;">{health_data['process_memory_mb']:.0f} MB</div>
-                <div style="color: #999; font-size: 0.8rem;">{method_info}</div>
-            </div>
-            """, unsafe_allow_html=True)
+                <div class="status-{color}" style="font-size: 1.5rem; margin-bottom: 0.5rem;">{title}</div>
+                <div style="color: white; font-size: 2rem; font-weight: bold;">{value}</div>
+                <div style="color: #999; font-size: 0.8rem;">{subtitle}</div>
+            </div>""".strip()
+            for color, title, value, subtitle in metric_cards
+        )
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{cards_html}</div>',
+            unsafe_allow_html=True
+        )
         
         # Performance chart (simplified for fallback mode)
         st.markdown("## 📊 Performance Monitoring")
         
         if health_data['method'] == 'psutil':
-            # Full monitoring available
-            # Simulate performance data (in real app, this would be stored)
-            if 'performance_history' not in st.session_state:
-                st.session_state.performance_history = []
-            
-            # Add current data point
-            st.session_state.performance_history.append({
-                'timestamp': datetime.now(),
-                'cpu': health_data['cpu_percent'],
-                'memory': health_data['memory_percent']
-            })
-            
-            # Keep only last 50 data points
-            if len(st.session_state.performance_history) > 50:
-                st.session_state.performance_history = st.session_state.performance_history[-50:]
+            # Full monitoring available - history is sampled in the background
+            history = list(get_metrics_buffer())
             
             # Create performance chart
-            if len(st.session_state.performance_history) > 1:
-                df = pd.DataFrame(st.session_state.performance_history)
+            if len(history) > 1:
+                # Imported lazily - only this chart needs plotly
+                import plotly.graph_objects as go
+                
+                # Plotly takes plain sequences - no DataFrame needed per tick
+                timestamps = [sample['timestamp'] for sample in history]
+                cpu_values = [sample['cpu'] for sample in history]
+                memory_values = [sample['memory'] for sample in history]
                 
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=df['timestamp'],
-                    y=df['cpu'],
+                fig.add_trace(go.Scattergl(
+                    x=timestamps,
+                    y=cpu_values,
                     mode='lines+markers',
                     name='CPU %',
                     line=dict(color='#10B981', width=2)
                 ))
-                fig.add_trace(go.Scatter(
-                    x=df['timestamp'],
-                    y=df['memory'],
+                fig.add_trace(go.Scattergl(
+                    x=timestamps,
+                    y=memory_values,
                     mode='lines+markers',
                     name='Memory %',
                     line=dict(color='#3B82F6', width=2)
@@ -409,8 +546,12 @@ def show_system_dashboard():
         
         # Auto-refresh option
         if st.checkbox("Auto-refresh (5 seconds)"):
-            time.sleep(5)
-            st.rerun()
+            if AUTOREFRESH_AVAILABLE:
+                # Rerun is scheduled client-side; the script thread stays free
+                st_autorefresh(interval=5000, key="system_health_refresh")
+            else:
+                time.sleep(5)
+                st.rerun()
     
     else:
         st.error(f"Error getting system health: {health_data['error']}")
@@ -423,31 +564,35 @@ def show_data_validation():
     # Run validation
     validation_results = validate_data_files()
     
-    # Display results
+    # Display results - all cards in a single markdown call
+    cards_html = []
     for result in validation_results:
-        status_class = f"status-{result['status']}"
+        records_html = ""
+        if 'records' in result:
+            records_label = "counting..." if result['records'] is None else f"{result['records']:,}"
+            records_html = f"""
+            <div style="color: #64748B; font-size: 0.8rem;">
+                Records: {records_label} | Columns: {len(result['columns'])}
+            </div>"""
         
-        st.markdown(f"""
+        cards_html.append(f"""
         <div class="debug-card">
-            <div class="{status_class}" style="font-size: 1.2rem; font-weight: bold; margin-bottom: 0.5rem;">
+            <div class="status-{result['status']}" style="font-size: 1.2rem; font-weight: bold; margin-bottom: 0.5rem;">
                 {result['file']}
             </div>
             <div style="color: #CBD5E1; margin-bottom: 0.5rem;">
                 {result['message']}
-            </div>
-        """, unsafe_allow_html=True)
-        
+            </div>{records_html}
+        </div>
+        """)
+    
+    st.markdown("\n".join(cards_html), unsafe_allow_html=True)
+    
+    # Column listings stay as widgets below the cards
+    for result in validation_results:
         if 'records' in result:
-            st.markdown(f"""
-                <div style="color: #64748B; font-size: 0.8rem;">
-                    Records: {result['records']:,} | Columns: {len(result['columns'])}
-                </div>
-            """, unsafe_allow_html=True)
-            
             if st.checkbox(f"Show columns for {result['file']}", key=f"show_cols_{result['file']}"):
                 st.code(", ".join(result['columns']))
-        
-        st.markdown('</div>', unsafe_allow_html=True)
 
 def show_navigation_testing():
     """Navigation and function testing"""
@@ -457,20 +602,21 @@ def show_navigation_testing():
     # Run navigation tests
     nav_results = test_navigation_functions()
     
-    # Display results
-    for result in nav_results:
-        status_class = f"status-{result['status']}"
-        
-        st.markdown(f"""
+    # Display results - all cards in a single markdown call
+    cards_html = "\n".join(
+        f"""
         <div class="debug-card">
-            <div class="{status_class}" style="font-size: 1.1rem; font-weight: bold; margin-bottom: 0.5rem;">
+            <div class="status-{result['status']}" style="font-size: 1.1rem; font-weight: bold; margin-bottom: 0.5rem;">
                 {result['function']}
             </div>
             <div style="color: #CBD5E1;">
                 {result['message']}
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """
+        for result in nav_results
+    )
+    st.markdown(cards_html, unsafe_allow_html=True)
     
     # Test dashboard launch
     st.markdown("## 🚀 Dashboard Launch Test")
@@ -482,8 +628,7 @@ def show_navigation_testing():
             st.info("Testing main dashboard launch...")
             try:
                 # Test if reputation_dashboard.py exists and is runnable
-                dashboard_path = Path("reputation_dashboard.py")
-                if dashboard_path.exists():
+                if stat_or_none(DASHBOARD_PATH):
                     st.success("✅ Main dashboard file found")
                     st.code("streamlit run reputation_dashboard.py --server.port 8501")
                 else:
@@ -496,8 +641,7 @@ def show_navigation_testing():
             st.info("Testing simple dashboard launch...")
             try:
                 # Test if simple dashboard exists
-                simple_path = Path("simple dahsboard.py")
-                if simple_path.exists():
+                if stat_or_none("simple dahsboard.py"):
                     st.success("✅ Simple dashboard file found")
                     st.code('streamlit run "simple dahsboard.py" --server.port 8502')
                 else:
@@ -505,6 +649,13 @@ def show_navigation_testing():
             except Exception as e:
                 st.error(f"❌ Error testing simple dashboard: {str(e)}")
 
+def data_files_changed():
+    """True if any data file mtime moved since the last check (or on the first check)"""
+    current_mtimes = {str(path): file_mtime(path) for path in DATA_FILE_PATHS}
+    previous_mtimes = st.session_state.get('data_file_mtimes')
+    st.session_state.data_file_mtimes = current_mtimes
+    return previous_mtimes != current_mtimes
+
 def show_cache_management():
     """Cache management and optimization"""
     st.markdown('# 🗄️ Cache Management')
@@ -514,7 +665,7 @@ def show_cache_management():
     st.markdown("## 📋 Cache Status")
     
     cache_info = {
-        'data_cache': len(st.session_state) if hasattr(st.session_state, '__len__') else 0,
+        'data_cache': len(st.session_state),
         'cache_hits': "Monitoring...",
         'cache_misses': "Monitoring...",
         'memory_usage': "Calculating..."
@@ -564,29 +715,52 @@ def show_cache_management():
     
     with col2:
         if st.button("Clear Session State", type="secondary"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             st.success("✅ Session state cleared")
     
     with col3:
         if st.button("Force Refresh", type="primary"):
-            st.cache_data.clear()
+            # Only invalidate cached data when a data file actually changed
+            if data_files_changed():
+                st.cache_data.clear()
+            else:
+                # Still pick up new log files on the Error Logs page
+                list_log_files.clear()
             st.rerun()
 
+@st.cache_data(ttl=LOG_LIST_CACHE_TTL)
+def list_log_files():
+    """Paths of *.log files in the log directories, listed with os.scandir"""
+    log_files = []
+    for log_dir in LOG_DIRS:
+        try:
+            entries = os.scandir(log_dir)
+        except OSError:
+            continue
+        with entries:
+            log_files.extend(
+                entry.path for entry in entries
+                if entry.name.endswith('.log') and entry.is_file()
+            )
+    return sorted(log_files)
+
+def read_log_tail(path, max_bytes):
+    """Return (text, truncated) for the last max_bytes of a log file"""
+    size = os.path.getsize(path)
+    if size == 0:
+        # mmap cannot map an empty file
+        return "", False
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        tail = mm[-max_bytes:]
+    return tail.decode('utf-8', errors='replace'), size > max_bytes
+
 def show_error_logs():
     """Error logging and monitoring"""
     st.markdown('# 📋 Error Logs')
     st.markdown('Monitor and debug application errors')
     
     # Check for log files
-    log_files = []
-    log_dirs = ["logs", "scripts/logs"]
-    
-    for log_dir in log_dirs:
-        log_path = Path(log_dir)
-        if log_path.exists():
-            for log_file in log_path.glob("*.log"):
-                log_files.append(log_file)
+    log_files = list_log_files()
     
     if log_files:
         st.markdown("## 📁 Available Log Files")
@@ -594,15 +768,25 @@ def show_error_logs():
         selected_log = st.selectbox(
             "Select log file to view:",
             log_files,
-            format_func=lambda x: f"{x.parent.name}/{x.name}"
+            format_func=lambda x: f"{os.path.basename(os.path.dirname(x))}/{os.path.basename(x)}"
         )
         
         if selected_log:
+            log_name = os.path.basename(selected_log)
+            tail_kb = st.slider(
+                "Tail size (KB):",
+                min_value=16,
+                max_value=1024,
+                value=LOG_TAIL_DEFAULT_KB,
+                step=16
+            )
+            
             try:
-                with open(selected_log, 'r') as f:
-                    log_content = f.read()
+                log_content, truncated = read_log_tail(selected_log, tail_kb * 1024)
                 
-                st.markdown(f"### {selected_log.name}")
+                st.markdown(f"### {log_name}")
+                if truncated:
+                    st.caption(f"Showing the last {tail_kb} KB of the log")
                 st.text_area(
                     "Log contents:",
                     log_content,
@@ -610,13 +794,14 @@ def show_error_logs():
                     disabled=True
                 )
                 
-                # Download button
-                st.download_button(
-                    label="📥 Download Log",
-                    data=log_content,
-                    file_name=selected_log.name,
-                    mime="text/plain"
-                )
+                # Download button - full file, streamed from the handle
+                with open(selected_log, 'rb') as log_handle:
+                    st.download_button(
+                        label="📥 Download Log",
+                        data=log_handle,
+                        file_name=log_name,
+                        mime="text/plain"
+                    )
                 
             except Exception as e:
                 st.error(f"Error reading log file: {str(e)}")
@@ -14,31 +14,30 @@ Enhanced features:
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import re
 from collections import Counter
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import seaborn as sns
+from bisect import bisect_right
 import base64
+from io import BytesIO
 from pathlib import Path
 import sys
 import time
 sys.path.append('scripts')
-from crisis_detection_engine import CrisisDetectionEngine
-from executive_reporting_engine import ExecutiveReportingEngine
 import json
-import os
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from io import BytesIO
-import base64
+import hashlib
 # Removed obsolete toggle_component import - using native Streamlit toggles
 
+# Optional PyArrow CSV parser - multi-threaded and much faster on wide text columns
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Import theme system for dynamic theming
 try:
     from src.themes.theme_provider import get_current_theme, generate_theme_css
@@ -56,29 +55,26 @@ st.set_page_config(
 )
 
 # 🎨 CUSTOM CSS - CRIMZON DARK THEME
+@st.cache_resource
+def _logo_b64():
+    """Read and encode the logo once per process: (base64, data URI), or None if missing"""
+    logo_path = Path("assets/images/percepta_logo.png")
+    if not logo_path.exists():
+        return None
+    encoded_image = base64.b64encode(logo_path.read_bytes()).decode()
+    return encoded_image, f"data:image/png;base64,{encoded_image}"
+
 def load_logo_image():
     """Load and encode the Percepta Pro logo image"""
     try:
-        import os
-        logo_path = "assets/images/percepta_logo.png"
-        if os.path.exists(logo_path):
-            with open(logo_path, "rb") as image_file:
-                encoded_image = base64.b64encode(image_file.read()).decode()
-                return f"data:image/png;base64,{encoded_image}"
-        return None
+        logo = _logo_b64()
+        return logo[1] if logo else None
     except Exception as e:
         st.error(f"Error loading logo: {e}")
         return None
 
-def load_custom_css():
-    """Load CSS with dynamic theme system integration"""
-    # Import theme system
-    try:
-        from src.themes.theme_provider import generate_theme_css
-        theme_variables = generate_theme_css()
-    except ImportError:
-        # Fallback to hardcoded Crimzon theme if import fails
-        theme_variables = """
+# Hardcoded Crimzon theme variables, used if the theme system import fails
+_FALLBACK_THEME_VARIABLES = """
     :root {
         /* Primary Colors - Fallback Crimzon Values */
         --primary-color: #FF4757;
@@ -130,14 +126,17 @@ def load_custom_css():
         --gradient-secondary: linear-gradient(135deg, #FF6348 0%, #FFA502 100%);
         --gradient-accent: linear-gradient(135deg, #22C55E 0%, #16A34A 100%);
     }"""
-    
-    css_content = """
+
+# Static stylesheet around the theme variables - built once at import
+_CSS_HEAD = """
     <style>
     /* Import Professional Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
     /* Dynamic Theme Variables */
-    """ + theme_variables + """
+    """
+
+_CSS_BODY = """
     
     /* Main App Background - Layout Specifications */
     .stApp {
@@ -765,8 +764,25 @@ def load_custom_css():
     footer {visibility: hidden;}
     </style>
     """
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def build_custom_css(theme_name):
+    """Assemble the full stylesheet for a theme; cached per theme name"""
+    try:
+        from src.themes.theme_provider import generate_theme_css
+        theme_variables = generate_theme_css()
+    except ImportError:
+        # Fallback to hardcoded Crimzon theme if import fails
+        theme_variables = _FALLBACK_THEME_VARIABLES
+    
+    return _CSS_HEAD + theme_variables + _CSS_BODY
+
+def load_custom_css():
+    """Load CSS with dynamic theme system integration"""
+    theme_name = st.session_state.get('current_theme', 'crimzon-dark')
     
-    st.markdown(css_content, unsafe_allow_html=True)
+    # Sent on every rerun - Streamlit drops elements a rerun does not re-send
+    st.markdown(build_custom_css(theme_name), unsafe_allow_html=True)
 
 def create_metric_card(title, value, change=None, change_type="neutral", icon="📊"):
     """Create a professional metric card using exact JSON design system specifications"""
@@ -784,9 +800,39 @@ def create_metric_card(title, value, change=None, change_type="neutral", icon="
     </div>
     """
 
+def display_df_fast(df, key, max_rows=5000, **kwargs):
+    """Render a DataFrame, sending at most max_rows rows to the browser per rerun"""
+    if len(df) <= max_rows:
+        st.dataframe(df, **kwargs)
+        return
+    
+    start = st.slider(
+        "Start row",
+        min_value=0,
+        max_value=len(df) - max_rows,
+        value=0,
+        step=max_rows // 10,
+        key=f"{key}_start_row"
+    )
+    st.dataframe(df.iloc[start:start + max_rows], **kwargs)
+
+# 🚨 INTELLIGENCE ENGINES - imported on first use, not on every page
+
+@st.cache_resource
+def get_crisis_engine():
+    """Crisis detection engine, created once per process"""
+    from crisis_detection_engine import CrisisDetectionEngine
+    return CrisisDetectionEngine()
+
+@st.cache_resource
+def get_reporting_engine():
+    """Executive reporting engine, created once per process"""
+    from executive_reporting_engine import ExecutiveReportingEngine
+    return ExecutiveReportingEngine()
+
 # 🔮 PHASE 3C HELPER FUNCTIONS
 
-@st.cache_data
+@st.cache_data(ttl="1h", max_entries=2)
 def load_phase3c_predictions():
     """Load Phase 3C predictive analytics results"""
     try:
@@ -796,12 +842,17 @@ def load_phase3c_predictions():
     except FileNotFoundError:
         return None
 
-@st.cache_data
+@st.cache_resource(ttl="1h", show_spinner=False)
+def get_phase3c_predictions():
+    """Phase 3C report shared read-only across reruns and sessions (no per-call copy)"""
+    return load_phase3c_predictions()
+
+@st.cache_data(ttl="15m", max_entries=4, show_spinner=False)
 def load_optimized_datasets():
     """Load ML-ready datasets"""
     try:
-        videos_df = pd.read_csv('backend/data/videos/youtube_videos_ml_ready.csv')
-        comments_df = pd.read_csv('backend/data/comments/youtube_comments_ai_enhanced_cleaned.csv')
+        videos_df = read_csv_fast('backend/data/videos/youtube_videos_ml_ready.csv')
+        comments_df = read_csv_fast('backend/data/comments/youtube_comments_ai_enhanced_cleaned.csv')
         return videos_df, comments_df
     except FileNotFoundError:
         return None, None
@@ -809,23 +860,64 @@ def load_optimized_datasets():
 def get_logo_base64():
     """Get base64 encoded logo for display"""
     try:
-        logo_path = "assets/images/percepta_logo.png"
-        if os.path.exists(logo_path):
-            with open(logo_path, "rb") as image_file:
-                encoded_image = base64.b64encode(image_file.read()).decode()
-                return encoded_image
-        return ""
+        logo = _logo_b64()
+        return logo[0] if logo else ""
     except Exception:
         return ""
 
 # 📊 MAIN DATA LOADING FUNCTIONS
 
-@st.cache_data
-def load_reputation_data():
-    """Load and process reputation monitoring data with language preference support"""
-    # Load final processed data files that actually exist
-    videos_path = Path("backend/data/videos/youtube_videos_final.csv")
+# Bumped whenever parsed CSV contents change shape, so Parquet sidecars and the
+# persisted frame cache written by an older reader are not reused
+CSV_READER_VERSION = 2
+
+def read_csv_fast(path):
+    """Read a CSV with the PyArrow parser, falling back to the pandas C engine"""
+    if PYARROW_AVAILABLE:
+        try:
+            # Comment text can contain quoted line breaks; empty string cells
+            # load as NaN (not "") to match pd.read_csv
+            table = pa_csv.read_csv(
+                path,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+            )
+            return table.to_pandas()
+        except pa.ArrowInvalid:
+            pass
+    return pd.read_csv(path)
+
+def read_csv_with_parquet_sidecar(csv_path):
+    """Read a CSV, preferring a Parquet copy next to it that is at least as new"""
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix(f'.v{CSV_READER_VERSION}.parquet')
+    
+    if PYARROW_AVAILABLE:
+        try:
+            if parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                return pd.read_parquet(parquet_path, engine='pyarrow')
+        except (OSError, pa.ArrowException):
+            pass
+    
+    df = read_csv_fast(csv_path)
+    
+    if PYARROW_AVAILABLE:
+        # The sidecar is only an optimisation - never fail the load over it
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception:
+            try:
+                parquet_path.unlink(missing_ok=True)
+            except OSError:
+                pass
     
+    return df
+
+# Per-day sentiment feature table written by the Phase 2B job next to the comments CSV
+SENTIMENT_DAILY_PATH = Path("backend/data/comments/sentiment_daily.parquet")
+
+def get_comments_path():
+    """Comments dataset the dashboard reads - enhanced if present, else the basic one"""
     # Use the enhanced comments dataset which has both original and translated content
     comments_path = Path("backend/data/comments/youtube_comments_ai_enhanced.csv")
     
@@ -833,89 +925,271 @@ def load_reputation_data():
     if not comments_path.exists():
         comments_path = Path("backend/data/comments/youtube_comments_final.csv")
     
+    return comments_path
+
+# Sentiment labels in the order the per-day count charts draw them
+SENTIMENT_LABELS = ['Positive', 'Neutral', 'Negative']
+SENTIMENT_LABEL_COLORS = {'Positive': '#22C55E', 'Neutral': '#9CA3AF', 'Negative': '#EF4444'}
+
+def categorize_sentiment(sentiment_values):
+    """Positive / Negative / Neutral labels for numeric scores using the +/-0.1 cut-offs"""
+    # NaN fails both comparisons and lands in Neutral
+    return pd.Categorical.from_codes(
+        np.select([sentiment_values > 0.1, sentiment_values < -0.1], [0, 1], default=2),
+        categories=['Positive', 'Negative', 'Neutral']
+    )
+
+# Days per unit of a relative upload date; minutes and hours ago count as today
+RELATIVE_AGE_DAYS = {'minute': 0, 'hour': 0, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+def parse_relative_upload_age(upload_text):
+    """Age of relative upload dates like "4 days ago" as timedelta (NaT for anything else)"""
+    text = upload_text.astype(str).str.strip().str.lower()
+    # One regex pass pulls the count and unit out of every row
+    parts = text.str.extract(r'(\d+)\s*(minute|hour|day|week|month|year)s?\s+ago')
+    
+    number = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype=np.float64)
+    days_per_unit = parts[1].map(RELATIVE_AGE_DAYS).to_numpy(dtype=np.float64)
+    age_days = number * days_per_unit
+    
+    # A stream without a stated age is treated as live today
+    undated_stream = np.isnan(age_days) & text.str.contains('streamed', regex=False).to_numpy()
+    age_days[undated_stream] = 0.0
+    return pd.to_timedelta(age_days, unit='D')
+
+def _data_file_version(path):
+    """(path, modification time, reader version) - changes whenever the file is rewritten"""
+    try:
+        return str(path), path.stat().st_mtime_ns, CSV_READER_VERSION
+    except OSError:
+        return str(path), None, CSV_READER_VERSION
+
+# Persisted to disk so an app restart reloads the processed frames from the pickle
+# instead of re-parsing the CSVs. Persisted caches ignore ttl, so the file versions
+# in the key are what expire an entry when the pipeline rewrites a dataset
+@st.cache_data(persist="disk", max_entries=4, show_spinner="Loading reputation data…")
+def _load_reputation_frames(videos_version, comments_version):
+    """Read and preprocess the videos and comments datasets for the given file versions"""
+    videos_path = Path(videos_version[0])
+    comments_path = Path(comments_version[0])
+    
+    videos_df = read_csv_with_parquet_sidecar(videos_path)
+    comments_df = read_csv_with_parquet_sidecar(comments_path)
+    
+    # Data preprocessing
+    # Scraped upload dates can be relative ("3 weeks ago", "Streamed 2 days ago"); keep
+    # their age before the datetime parse below turns that text into NaT
+    raw_upload_col = 'UploadDate' if 'UploadDate' in videos_df.columns else 'Upload Date'
+    if raw_upload_col in videos_df.columns and videos_df[raw_upload_col].dtype == object:
+        videos_df['UploadAge'] = parse_relative_upload_age(videos_df[raw_upload_col])
+    
+    # Handle different date column names in final datasets
+    if 'UploadDate' in videos_df.columns:
+        videos_df['Upload Date'] = pd.to_datetime(videos_df['UploadDate'], errors='coerce')
+    elif 'Upload Date' in videos_df.columns:
+        videos_df['Upload Date'] = pd.to_datetime(videos_df['Upload Date'], errors='coerce')
+    
+    # Explicit formats keep parsing on the vectorized path; cache=True parses
+    # each distinct date string once (many comments share a day)
+    if 'Date_Formatted' in comments_df.columns:
+        comments_df['Date'] = pd.to_datetime(comments_df['Date_Formatted'], format='%d-%m-%Y', errors='coerce', cache=True)
+    elif 'Date' in comments_df.columns:
+        # Raw YouTube API publishedAt timestamps are ISO 8601
+        comments_df['Date'] = pd.to_datetime(comments_df['Date'], format='ISO8601', errors='coerce', cache=True)
+    
+    # Calendar day of each comment, shared by every per-day chart
+    if 'Date' in comments_df.columns:
+        comments_df['DateOnly'] = comments_df['Date'].dt.normalize()
+    
+    # Parse the AI score column once here rather than in every insight pass
+    if 'SentimentScore_EN' in comments_df.columns:
+        comments_df['SentimentScore_EN'] = pd.to_numeric(comments_df['SentimentScore_EN'], errors='coerce')
+    
+    # Clean sentiment data - the final dataset should have 'Sentiment' and 'SentLabel' columns
+    if 'Sentiment' in comments_df.columns:
+        comments_df['Sentiment'] = pd.to_numeric(comments_df['Sentiment'], errors='coerce')
+    elif 'SentimentScore_EN' in comments_df.columns:
+        comments_df['Sentiment'] = comments_df['SentimentScore_EN']
+    else:
+        comments_df['Sentiment'] = 0.0
+    
+    # Ensure we have SentLabel column (should already exist in final dataset)
+    if 'SentLabel' not in comments_df.columns and 'Sentiment' in comments_df.columns:
+        # Create SentLabel from numeric Sentiment if missing
+        comments_df['SentLabel'] = categorize_sentiment(comments_df['Sentiment'].to_numpy())
+    
+    if 'ProcessingStatus' in videos_df.columns:
+        videos_df['ProcessingStatus'] = videos_df['ProcessingStatus'].astype('category')
+    
+    # YouTube video ID for the card thumbnails, pulled from watch and youtu.be links in one pass
+    if 'URL' in videos_df.columns:
+        videos_df['YouTubeID'] = videos_df['URL'].astype(str).str.extract(
+            r'(?:youtube\.com/watch\?v=|youtu\.be/)([A-Za-z0-9_-]{11})', expand=False
+        )
+    
+    # Placeholder view/comment counts for the video cards, seeded from the card's title
+    # and channel text - hashed once per load instead of per card on every rerun
+    if not videos_df.empty:
+        titles = videos_df['Title'].astype(str) if 'Title' in videos_df.columns else pd.Series('No Title', index=videos_df.index)
+        card_titles = titles.str[:60] + np.where(titles.str.len() > 60, '...', '')
+        channels = videos_df['Channel'].astype(str) if 'Channel' in videos_df.columns else pd.Series('Unknown Channel', index=videos_df.index)
+        demo_seeds = np.array(
+            [int(hashlib.md5(f"{title}{channel}".encode()).hexdigest()[:6], 16) for title, channel in zip(card_titles, channels)],
+            dtype=np.int64
+        )
+        videos_df['DemoViews'] = demo_seeds % 50000 + 1000
+        videos_df['DemoComments'] = demo_seeds % 500 + 10
+    
+    # Engagement counts fit comfortably in narrower ints - the smallest fitting type
+    # halves (or better) the bytes every sum/mean/threshold scan moves. Counts with
+    # gaps load as float; those drop to float32 only when every value stays exact
+    for count_col in ('LikeCount', 'ReplyCount'):
+        if count_col in comments_df.columns and pd.api.types.is_integer_dtype(comments_df[count_col]):
+            comments_df[count_col] = pd.to_numeric(comments_df[count_col], downcast='integer')
+        elif count_col in comments_df.columns and pd.api.types.is_float_dtype(comments_df[count_col]):
+            comments_df[count_col] = pd.to_numeric(comments_df[count_col], downcast='float')
+    
+    # Label columns hold a handful of repeated strings - store them as categories
+    # (the Phase 2B status columns too - smaller frames are cheaper for every cache copy)
+    for label_col in ('SentLabel', 'SentimentLabel_EN', 'SentimentLabel_TE', 'ThreatLevel', 'ModerationStatus', 'ProcessingStatus'):
+        if label_col in comments_df.columns:
+            comments_df[label_col] = comments_df[label_col].astype('category')
+    
+    # Clean data - float32 halves the bytes every sentiment reduction scans.
+    # Cast after SentLabel so the +/-0.1 thresholds see float64 values
+    comments_df['Sentiment'] = comments_df['Sentiment'].astype('float32')
+    comments_df = comments_df.dropna(subset=['Sentiment']).reset_index(drop=True)
+    
+    return videos_df, comments_df
+
+def load_reputation_data():
+    """Load and process reputation monitoring data with language preference support"""
+    # Load final processed data files that actually exist
+    videos_path = Path("backend/data/videos/youtube_videos_final.csv")
+    comments_path = get_comments_path()
+    
+    # Failures raise out of the cached loader, so they are never persisted
     try:
-        videos_df = pd.read_csv(videos_path)
-        comments_df = pd.read_csv(comments_path)
-        
-        # Data preprocessing
-        # Handle different date column names in final datasets
-        if 'UploadDate' in videos_df.columns:
-            videos_df['Upload Date'] = pd.to_datetime(videos_df['UploadDate'], errors='coerce')
-        elif 'Upload Date' in videos_df.columns:
-            videos_df['Upload Date'] = pd.to_datetime(videos_df['Upload Date'], errors='coerce')
-        
-        if 'Date_Formatted' in comments_df.columns:
-            comments_df['Date'] = pd.to_datetime(comments_df['Date_Formatted'], format='%d-%m-%Y', errors='coerce')
-        elif 'Date' in comments_df.columns:
-            comments_df['Date'] = pd.to_datetime(comments_df['Date'], errors='coerce')
-        
-        # Clean sentiment data - the final dataset should have 'Sentiment' and 'SentLabel' columns
-        if 'Sentiment' in comments_df.columns:
-            comments_df['Sentiment'] = pd.to_numeric(comments_df['Sentiment'], errors='coerce')
-        elif 'SentimentScore_EN' in comments_df.columns:
-            comments_df['Sentiment'] = pd.to_numeric(comments_df['SentimentScore_EN'], errors='coerce')
-        else:
-            comments_df['Sentiment'] = 0.0
-        
-        # Ensure we have SentLabel column (should already exist in final dataset)
-        if 'SentLabel' not in comments_df.columns and 'Sentiment' in comments_df.columns:
-            # Create SentLabel from numeric Sentiment if missing
-            comments_df['SentLabel'] = comments_df['Sentiment'].apply(
-                lambda x: 'Positive' if x > 0.1 else 'Negative' if x < -0.1 else 'Neutral'
-            )
-        
-        # Clean data
-        comments_df = comments_df.dropna(subset=['Sentiment'])
-        
-        return videos_df, comments_df
+        return _load_reputation_frames(_data_file_version(videos_path), _data_file_version(comments_path))
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame(), pd.DataFrame()
 
-def get_language_aware_comments(comments_df):
+# The dashboard script re-executes on every rerun, so this starts empty each run
+_RUN_DATA = {}
+
+def get_reputation_data():
+    """load_reputation_data() once per script run - the sidebar and page share the frames"""
+    # st.cache_data hands back a fresh unpickled copy on every call; take one per run
+    if 'reputation' not in _RUN_DATA:
+        _RUN_DATA['reputation'] = load_reputation_data()
+    return _RUN_DATA['reputation']
+
+def get_display_comments(comments_df, language_mode):
+    """Build the DisplayComment column for a language preference as a standalone Series"""
+    if language_mode == 'Telugu':
+        # Telugu mode: Show original comments (Comment column)
+        if 'Comment' in comments_df.columns:
+            return comments_df['Comment'].fillna('')
+        if 'Comment_EN' in comments_df.columns:
+            return comments_df['Comment_EN'].fillna('')
+    else:
+        # English mode: Show translated comments (Comment_EN) with fallback to Comment
+        if 'Comment_EN' in comments_df.columns:
+            if 'Comment' in comments_df.columns:
+                return comments_df['Comment_EN'].fillna(comments_df['Comment'])
+            return comments_df['Comment_EN'].fillna('')
+        if 'Comment' in comments_df.columns:
+            return comments_df['Comment'].fillna('')
+    return pd.Series('', index=comments_df.index)
+
+def get_language_aware_comments(comments_df, language_mode=None):
     """Process comments based on current language preference"""
     if comments_df.empty:
         return comments_df
     
-    # Get current language preference from session state
-    language_mode = st.session_state.get('language_mode', 'English')
+    # Default to the current language preference from session state
+    if language_mode is None:
+        language_mode = st.session_state.get('language_mode', 'English')
     
-    # Create a copy to avoid modifying the original cached data
-    processed_comments = comments_df.copy()
+    # load_reputation_data is st.cache_data, which already hands every script run
+    # its own copy - the column can be attached without another full copy
+    comments_df['DisplayComment'] = get_display_comments(comments_df, language_mode)
     
-    if language_mode == 'Telugu':
-        # Telugu mode: Show original comments (Comment column)
-        # Use 'Comment' as the primary display column
-        if 'Comment' in processed_comments.columns:
-            processed_comments['DisplayComment'] = processed_comments['Comment'].fillna('')
-        else:
-            processed_comments['DisplayComment'] = processed_comments.get('Comment_EN', '').fillna('')
-    else:
-        # English mode: Show translated comments (Comment_EN column)  
-        # Use 'Comment_EN' as primary with fallback to 'Comment'
-        if 'Comment_EN' in processed_comments.columns:
-            processed_comments['DisplayComment'] = processed_comments['Comment_EN'].fillna(
-                processed_comments.get('Comment', '')
-            )
-        else:
-            processed_comments['DisplayComment'] = processed_comments.get('Comment', '').fillna('')
+    return comments_df
+
+def _reputation_score_numpy(sentiments):
+    """Mean of sentiments mapped from [-1, 1] onto 0-100, ignoring NaN"""
+    valid = sentiments[~np.isnan(sentiments)]
+    if valid.size == 0:
+        return 50.0
+    return (float(valid.mean()) + 1.0) * 50.0
+
+def _daily_mean_numpy(day_ordinals, sentiments):
+    """Per-day mean sentiment for day ordinals sorted ascending"""
+    days, starts = np.unique(day_ordinals, return_index=True)
+    valid = ~np.isnan(sentiments)
+    sums = np.add.reduceat(np.where(valid, sentiments, 0.0), starts) if days.size else np.zeros(0)
+    counts = np.add.reduceat(valid.astype(np.int64), starts) if days.size else np.zeros(0, dtype=np.int64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return days, sums / counts
+
+@st.cache_data(ttl="15m", max_entries=8, show_spinner=False)
+def _daily_sentiment(dates, sentiments):
+    """Per-day aggregation over raw arrays; cached on the array contents"""
+    has_date = ~np.isnat(dates)
+    
+    day_ordinals = dates[has_date].astype('datetime64[D]').astype(np.int64)
+    sentiments = sentiments[has_date]
+    order = np.argsort(day_ordinals, kind='stable')
+    
+    days, means = _daily_mean_numpy(day_ordinals[order], sentiments[order])
+    return days.astype('datetime64[D]').astype('datetime64[ns]'), means
+
+def daily_sentiment_means(comments_df):
+    """Daily mean sentiment as (dates, means) arrays, skipping rows without a date"""
+    dates = pd.to_datetime(comments_df['Date'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+    sentiments = comments_df['Sentiment'].to_numpy(dtype=np.float64)
+    return _daily_sentiment(dates, sentiments)
+
+@st.cache_data(ttl="15m", max_entries=2, show_spinner=False)
+def load_daily_sentiment():
+    """All-time daily sentiment as (dates, means), read from the pre-aggregated feature table"""
+    if PYARROW_AVAILABLE:
+        try:
+            # Only trust the table if it was written after the current comments CSV
+            if SENTIMENT_DAILY_PATH.stat().st_mtime >= get_comments_path().stat().st_mtime:
+                daily = pd.read_parquet(SENTIMENT_DAILY_PATH, engine='pyarrow', columns=['Date', 'Sentiment'])
+                return (
+                    daily['Date'].to_numpy(dtype='datetime64[ns]'),
+                    daily['Sentiment'].to_numpy(dtype=np.float64)
+                )
+        except (OSError, KeyError, pa.ArrowException):
+            pass
     
-    return processed_comments
+    # Stale or missing table - aggregate from the loaded comments instead
+    _, comments_df = load_reputation_data()
+    if comments_df.empty:
+        return np.array([], dtype='datetime64[ns]'), np.array([], dtype=np.float64)
+    return daily_sentiment_means(comments_df)
 
 def calculate_reputation_score(comments_df):
     """Calculate overall reputation score (0-100)"""
     if comments_df.empty:
         return 50
     
-    sentiment_scores = comments_df['Sentiment'].dropna()
-    
-    # Convert sentiment range to 0-100 scale
-    # Assuming sentiment is in range [-1, 1]
-    normalized_sentiment = (sentiment_scores + 1) / 2 * 100
-    reputation_score = normalized_sentiment.mean()
+    # Sentiment in range [-1, 1] mapped onto a 0-100 scale and averaged in one pass
+    sentiment_scores = comments_df['Sentiment'].to_numpy()
+    reputation_score = _reputation_score_numpy(sentiment_scores)
     
     return round(reputation_score, 1)
 
+@st.cache_data(ttl="10m", show_spinner=False)
+def _count_label_codes(label_codes, categories):
+    """Counts per category from categorical codes (-1 marks missing labels)"""
+    counts = np.bincount(label_codes[label_codes >= 0], minlength=len(categories))
+    return dict(zip(categories, counts.tolist()))
+
 def get_sentiment_distribution(comments_df):
     """Get sentiment distribution from SentLabel column"""
     # Handle both old and new column names
@@ -928,7 +1202,13 @@ def get_sentiment_distribution(comments_df):
     if sentiment_col is None:
         return {"Positive": 0, "Neutral": 0, "Negative": 0}
     
-    sentiment_counts = comments_df[sentiment_col].value_counts()
+    # Labels are categorical from load - the int8 codes make a cheap cache key
+    labels = comments_df[sentiment_col]
+    if not isinstance(labels.dtype, pd.CategoricalDtype):
+        labels = labels.astype('category')
+    sentiment_counts = _count_label_codes(
+        labels.cat.codes.to_numpy(), tuple(labels.cat.categories)
+    )
     
     # Ensure all categories exist
     result = {
@@ -939,19 +1219,141 @@ def get_sentiment_distribution(comments_df):
     
     return result
 
-def create_sentiment_timeline(comments_df):
-    """Create sentiment timeline chart"""
-    if comments_df.empty:
-        return go.Figure()
+# Reputation status tiers: (ascending score thresholds, one entry per tier)
+SIDEBAR_REPUTATION_STATUS = (
+    (50, 70),
+    (
+        ("#FF4757", "CRITICAL"),
+        ("#FFA502", "MODERATE"),
+        ("#22C55E", "EXCELLENT"),
+    )
+)
+OVERVIEW_REPUTATION_STATUS = (
+    (30, 50, 70),
+    (
+        ("#EF4444", "🚨", "REPUTATION CRISIS", "linear-gradient(90deg, rgba(239, 68, 68, 0.05) 0%, rgba(239, 68, 68, 0.01) 100%)"),
+        ("#F59E0B", "⚠️", "REPUTATION WARNING", "linear-gradient(90deg, rgba(245, 158, 11, 0.05) 0%, rgba(245, 158, 11, 0.01) 100%)"),
+        ("#EAB308", "⚖️", "REPUTATION MODERATE", "linear-gradient(90deg, rgba(234, 179, 8, 0.05) 0%, rgba(234, 179, 8, 0.01) 100%)"),
+        ("#22C55E", "✅", "REPUTATION HEALTHY", "linear-gradient(90deg, rgba(34, 197, 94, 0.05) 0%, rgba(34, 197, 94, 0.01) 100%)"),
+    )
+)
+
+def reputation_status(score, status_table):
+    """Look up the status tuple for a reputation score (a score on a threshold moves up a tier)"""
+    thresholds, tiers = status_table
+    return tiers[bisect_right(thresholds, score)]
+
+# Card value colours, worst to best
+TRI_COLOR_PALETTE = ("#EF4444", "#FFA502", "#22C55E")
+
+def tri_color(value, lo, hi):
+    """Red below lo, amber from lo, green from hi (NaN counts as red)"""
+    return TRI_COLOR_PALETTE[(value >= lo) + (value >= hi)]
+
+def get_sentiment_summary(comments_df):
+    """Reputation score, label distribution and headline percentages in one place"""
+    # The sidebar and the overview summarise the same per-run frame - compute it once
+    cached = _RUN_DATA.get('sentiment_summary')
+    if cached is not None and cached[0] is comments_df:
+        return cached[1]
     
-    # Group by date and calculate daily sentiment
-    daily_sentiment = comments_df.groupby(comments_df['Date'].dt.date)['Sentiment'].mean().reset_index()
-    daily_sentiment['Date'] = pd.to_datetime(daily_sentiment['Date'])
+    sentiment_dist = get_sentiment_distribution(comments_df)
+    total_comments = sum(sentiment_dist.values())  # three-entry dict
+    
+    summary = {
+        'reputation_score': calculate_reputation_score(comments_df),
+        'sentiment_dist': sentiment_dist,
+        'total_comments': total_comments,
+        'positive_pct': 0,
+        'negative_pct': 0
+    }
+    if total_comments > 0:
+        summary['positive_pct'] = round((sentiment_dist['Positive'] / total_comments) * 100, 1)
+        summary['negative_pct'] = round((sentiment_dist['Negative'] / total_comments) * 100, 1)
+    
+    # Holding the frame keeps the identity check honest for the rest of the run
+    _RUN_DATA['sentiment_summary'] = (comments_df, summary)
+    return summary
+
+@st.cache_data(ttl="15m", max_entries=4, show_spinner=False)
+def _engagement_stats(sentiments, like_counts):
+    """Sentiment mean/spread and like totals over raw arrays; cached on the array contents"""
+    stats = {
+        'avg_sentiment': float(np.nanmean(sentiments)) if sentiments.size else 0,
+        # Sample standard deviation, as pandas' Series.std() reports it
+        'sentiment_std': float(np.nanstd(sentiments, ddof=1)) if sentiments.size > 1 else np.nan,
+        'total_likes': 0,
+        'avg_likes': 0
+    }
+    if like_counts is not None and like_counts.size:
+        if not np.issubdtype(like_counts.dtype, np.integer):
+            # Float counts carry NaN for missing values - drop them once
+            like_counts = like_counts[~np.isnan(like_counts)]
+        # One reduction: the mean follows from the sum
+        total_likes = like_counts.sum(dtype=np.float64 if like_counts.dtype.kind == 'f' else np.int64)
+        stats['total_likes'] = total_likes
+        stats['avg_likes'] = total_likes / like_counts.size if like_counts.size else np.nan
+    return stats
+
+def compute_analytics_kpis(comments_df):
+    """Headline analytics figures: sentiment summary plus engagement and averages"""
+    summary = get_sentiment_summary(comments_df)
+    
+    kpis = _engagement_stats(
+        comments_df['Sentiment'].to_numpy(dtype=np.float64) if 'Sentiment' in comments_df.columns else np.empty(0),
+        comments_df['LikeCount'].to_numpy() if 'LikeCount' in comments_df.columns else None
+    )
+    
+    total_comments = len(comments_df)
+    kpis.update(
+        total_comments=total_comments,
+        sentiment_dist=summary['sentiment_dist'],
+        reputation_score=summary['reputation_score'],
+        engagement_rate=(kpis['total_likes'] / total_comments * 100) if total_comments > 0 else 0
+    )
+    return kpis
+
+def get_daily_analytics(comments_df):
+    """Per-day tables behind the analytics charts, built once per script run"""
+    # 'daily': mean Sentiment, summed LikeCount and Comment count per day
+    # 'labels': comments per day and SentLabel (None without a label column)
+    cached = _RUN_DATA.get('daily_analytics')
+    if cached is not None and cached[0] is comments_df:
+        return cached[1]
+    
+    # One grouping pass feeds the timeline, engagement and trend charts
+    by_day = comments_df.groupby('DateOnly')
+    aggregations = {'Sentiment': ('Sentiment', 'mean')}
+    if 'LikeCount' in comments_df.columns:
+        aggregations['LikeCount'] = ('LikeCount', 'sum')
+    if 'Comment' in comments_df.columns:
+        aggregations['Comment'] = ('Comment', 'count')
+    
+    tables = {
+        'daily': by_day.agg(**aggregations).rename_axis('Date').reset_index(),
+        'labels': None
+    }
+    if 'SentLabel' in comments_df.columns:
+        # Every label gets a column (zeros if it never occurs) so the charts need no guards
+        tables['labels'] = (
+            comments_df.groupby(['DateOnly', 'SentLabel'], observed=True).size()
+            .unstack(fill_value=0).reindex(columns=SENTIMENT_LABELS, fill_value=0)
+        )
+    
+    _RUN_DATA['daily_analytics'] = (comments_df, tables)
+    return tables
+
+@st.cache_data(ttl="15m", max_entries=8, show_spinner=False)
+def build_sentiment_timeline_figure(dates, means):
+    """Sentiment timeline figure for daily (dates, means); cached until the series changes"""
+    daily_sentiment = pd.DataFrame({'Date': dates, 'Sentiment': means})
     
     fig = go.Figure()
     
     # Use dynamic color based on sentiment value
-    sentiment_colors = ['#EF4444' if s < -0.1 else '#22C55E' if s > 0.1 else '#9CA3AF' for s in daily_sentiment['Sentiment']]
+    sentiment_colors = np.select(
+        [means < -0.1, means > 0.1], ['#EF4444', '#22C55E'], default='#9CA3AF'
+    )
     
     fig.add_trace(go.Scatter(
         x=daily_sentiment['Date'],
@@ -978,23 +1380,148 @@ def create_sentiment_timeline(comments_df):
     
     return fig
 
-def create_video_impact_chart(videos_df):
-    """Create video impact analysis"""
-    if videos_df.empty:
+def create_sentiment_timeline(comments_df, daily_sentiment=None):
+    """Create sentiment timeline chart, optionally from precomputed (dates, means)"""
+    if daily_sentiment is not None:
+        return build_sentiment_timeline_figure(*daily_sentiment)
+    
+    if comments_df.empty:
         return go.Figure()
     
-    # Extract upload date and create impact metrics
-    recent_videos = videos_df.tail(20)  # Last 20 videos
+    # Group by date and calculate daily sentiment
+    dates, means = daily_sentiment_means(comments_df)
+    
+    return build_sentiment_timeline_figure(dates, means)
+
+# Daily lines longer than this are downsampled before they are sent to the browser
+TIMELINE_MAX_POINTS = 800
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the line's shape"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        
+        # Anchor on the mean of the next bucket (the last point for the final bucket)
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            anchor_x, anchor_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            anchor_x, anchor_y = x[-1], y[-1]
+        
+        # Keep the point forming the largest triangle with the previous pick and the anchor
+        area = np.abs(
+            (x[previous] - anchor_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (anchor_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    
+    return selected
+
+def downsample_timeline(dates, values, max_points=TIMELINE_MAX_POINTS):
+    """LTTB-downsample a daily (dates, values) series for plotting"""
+    keep = lttb_indices(dates.astype(np.int64).astype(np.float64), values, max_points)
+    return dates[keep], values[keep]
+
+def add_label_count_traces(fig, dates, label_counts, line_width, marker_size):
+    """One line per sentiment label from a per-day count table, each LTTB-downsampled"""
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    for sentiment in SENTIMENT_LABELS:
+        # Downsampled per label so every line keeps its own peaks
+        x, y = downsample_timeline(dates, label_counts[sentiment].to_numpy())
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            name=sentiment,
+            line=dict(width=line_width, color=SENTIMENT_LABEL_COLORS[sentiment]),
+            marker=dict(size=marker_size, color=SENTIMENT_LABEL_COLORS[sentiment])
+        ))
+
+@st.cache_data(ttl="15m", max_entries=8, show_spinner=False)
+def build_analytics_sentiment_figure(dates, means):
+    """Analytics page daily sentiment line; cached until the series changes"""
+    dates, means = downsample_timeline(dates, means)
+    
+    fig = go.Figure()
+    
+    # Use dynamic color based on sentiment value
+    sentiment_colors = np.select([means < -0.1, means > 0.1], ['#EF4444', '#22C55E'], default='#FFA502')
+    
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=means,
+        mode='lines+markers',
+        line=dict(color='#FF6348', width=3),
+        marker=dict(size=8, color=sentiment_colors),
+        hovertemplate='<b>%{x}</b><br>Sentiment: %{y:.2f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        height=300,
+        margin=dict(t=10, b=20, l=20, r=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(gridcolor='#404040', title="Date"),
+        yaxis=dict(gridcolor='#404040', title="Sentiment"),
+        showlegend=False
+    )
+    
+    return fig
+
+@st.cache_data(ttl="15m", max_entries=8, show_spinner=False)
+def build_engagement_figure(dates, rates):
+    """Analytics page daily engagement-rate line; cached until the series changes"""
+    dates, rates = downsample_timeline(dates, rates)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=rates,
+        mode='lines+markers',
+        line=dict(color='#FFA502', width=3),
+        marker=dict(size=6, color='#FFA502'),
+        name='Engagement Rate %',
+        hovertemplate='<b>%{x}</b><br>Engagement: %{y:.1f}%<extra></extra>'
+    ))
     
+    fig.update_layout(
+        height=300,
+        margin=dict(t=10, b=20, l=20, r=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(gridcolor='#404040', title="Date"),
+        yaxis=dict(gridcolor='#404040', title="Engagement Rate (%)"),
+        showlegend=False
+    )
+    
+    return fig
+
+@st.cache_data(ttl="10m", show_spinner=False)
+def build_video_impact_figure(video_index, short_titles):
+    """Impact bar chart for the given videos; cached until the recent videos change"""
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=recent_videos.index,
-        y=[1] * len(recent_videos),  # Placeholder for view impact
+        x=list(video_index),
+        y=np.ones(len(video_index), dtype=np.int8),  # Placeholder for view impact
         name='Video Impact',
         marker_color='#FF6348',
         hovertemplate='<b>%{customdata}</b><br>Impact Score: %{y}<extra></extra>',
-        customdata=recent_videos['Title'].str[:50] + '...'
+        customdata=list(short_titles)
     ))
     
     fig.update_layout(
@@ -1012,63 +1539,98 @@ def create_video_impact_chart(videos_df):
     
     return fig
 
+def create_video_impact_chart(videos_df):
+    """Create video impact analysis"""
+    if videos_df.empty:
+        return go.Figure()
+    
+    # Extract upload date and create impact metrics
+    recent_videos = videos_df.tail(20)  # Last 20 videos
+    
+    # Plain tuples keep the cache key hashable by value (object arrays hash by pointer)
+    return build_video_impact_figure(
+        tuple(recent_videos.index),
+        tuple(recent_videos['Title'].str[:50] + '...')
+    )
+
+# Word cloud text cleaning - one tokenizer pass, set lookups for the stopwords
+_WORD_RE = re.compile(r'\w+')
+_WORDCLOUD_STOPWORDS = frozenset((
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can', 'cant', 'dont', 'wont',
+    'isnt', 'arent', 'wasnt', 'werent', 'hasnt', 'havent', 'hadnt', 'didnt', 'doesnt',
+    'couldnt', 'shouldnt', 'wouldnt', 'youtube', 'video', 'comment', 'channel'
+))
+
+@st.cache_data(ttl="15m", max_entries=4, show_spinner=False)
+def _clean_wordcloud_text(comments):
+    """Joined, cleaned word cloud text; cached on the comment column's contents"""
+    # Combine all English comments (NaN and other non-text cells are skipped)
+    text = ' '.join([comment for comment in comments if isinstance(comment, str)])
+    
+    # Words are runs of word characters - punctuation splits them, common words are dropped
+    return ' '.join([word for word in _WORD_RE.findall(text.lower()) if word not in _WORDCLOUD_STOPWORDS])
+
+@st.cache_data(ttl="15m", max_entries=4, show_spinner=False)
+def get_word_frequencies(text):
+    """(word, count) pairs for cleaned word cloud text, most common first"""
+    words = text.split()
+    
+    if PYARROW_AVAILABLE:
+        # Arrow-backed strings hash in C; the stable sort keeps Counter's first-seen tie order
+        counts = pd.Series(words, dtype='string[pyarrow]').value_counts(sort=False)
+        counts = counts.sort_values(ascending=False, kind='stable')
+        return list(zip(counts.index.tolist(), counts.tolist()))
+    
+    # Counter's C counting loop beats object-dtype value_counts on plain str lists
+    return Counter(words).most_common()
+
+def wordcloud_frequencies(word_freq, stopwords, max_words=100):
+    """Top counts in the shape WordCloud.generate_from_frequencies expects"""
+    # Mirror WordCloud's own tokenizer: no stopwords, no single characters
+    frequencies = {}
+    for word, freq in word_freq:
+        if len(word) > 1 and word not in stopwords:
+            frequencies[word] = freq
+            if len(frequencies) == max_words:
+                break
+    return frequencies
+
+@st.cache_data(ttl="1h", max_entries=4, show_spinner=False)
+def render_wordcloud_png(text, width, height):
+    """Word cloud for cleaned text as PNG bytes; cached so reruns skip the layout pass"""
+    # Imported here - only the word cloud needs this heavy module
+    from wordcloud import WordCloud, STOPWORDS
+    
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color='black',
+        colormap='Reds',
+        max_words=100,
+        prefer_horizontal=0.7,
+        relative_scaling=0.5
+    ).generate_from_frequencies(wordcloud_frequencies(get_word_frequencies(text), STOPWORDS))
+    
+    buffer = BytesIO()
+    wordcloud.to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
 def create_wordcloud_analysis(comments_df):
     """Generate word cloud from comments"""
     if comments_df.empty or 'Comment_EN' not in comments_df.columns:
         return None
     
-    # Combine all English comments
-    text = ' '.join(comments_df['Comment_EN'].dropna().astype(str))
-    
-    # Remove common words and clean text
-    text = re.sub(r'[^\w\s]', ' ', text.lower())
-    text = re.sub(r'\b(the|and|or|but|in|on|at|to|for|of|with|by|a|an|is|are|was|were|be|been|have|has|had|do|does|did|will|would|could|should|may|might|can|cant|dont|wont|isnt|arent|wasnt|werent|hasnt|havent|hadnt|didnt|doesnt|couldnt|shouldnt|wouldnt|youtube|video|comment|channel)\b', ' ', text)
-    
-    return text
+    return _clean_wordcloud_text(comments_df['Comment_EN'])
 
-def get_ai_insights(videos_df, comments_df):
-    """Extract AI insights from processed data"""
-    insights = {
-        'total_videos_processed': 0,
-        'videos_with_transcripts': 0,
-        'videos_with_summaries': 0,
-        'avg_sentiment_score': 0.0,
-        'critical_keywords': [],
-        'processing_coverage': 0.0
-    }
-    
-    if not videos_df.empty:
-        insights['total_videos_processed'] = len(videos_df)
-        
-        # Count videos with AI processing
-        if 'Transcript_EN' in videos_df.columns:
-            insights['videos_with_transcripts'] = videos_df['Transcript_EN'].notna().sum()
-        if 'Summary_EN' in videos_df.columns:
-            insights['videos_with_summaries'] = videos_df['Summary_EN'].notna().sum()
-        if 'ProcessingStatus' in videos_df.columns:
-            completed = (videos_df['ProcessingStatus'] == 'completed').sum()
-            insights['processing_coverage'] = (completed / len(videos_df)) * 100
-    
-    if not comments_df.empty:
-        # Calculate average sentiment from AI processing
-        if 'SentimentScore_EN' in comments_df.columns:
-            sentiment_scores = pd.to_numeric(comments_df['SentimentScore_EN'], errors='coerce')
-            insights['avg_sentiment_score'] = sentiment_scores.mean()
-        
-        # Extract critical keywords
-        if 'Keywords_EN' in comments_df.columns:
-            all_keywords = []
-            for keywords in comments_df['Keywords_EN'].dropna():
-                if isinstance(keywords, str):
-                    all_keywords.extend(keywords.split(', '))
-            
-            # Get most common critical keywords
-            keyword_counts = Counter(all_keywords)
-            critical_terms = ['చేతబడి', 'అరెస్ట్', 'మాగంటి', 'death', 'threat', 'black magic', 'arrest']
-            insights['critical_keywords'] = [kw for kw, count in keyword_counts.most_common(10) 
-                                           if any(term in kw.lower() for term in critical_terms)]
-    
-    return insights
+def _sync_toggle_state(widget_key, state_key, on_value, off_value):
+    """Widget callback: copy a toggle into session state before the script reruns"""
+    st.session_state[state_key] = on_value if st.session_state[widget_key] else off_value
+
+def _set_current_page(page_name):
+    """Navigation button callback"""
+    st.session_state.current_page = page_name
 
 def create_sidebar():
     """🎯 REFACTORED SIDEBAR - Modern Crimzon Style with Percepta Navigation"""
@@ -1124,28 +1686,27 @@ def create_sidebar():
             current_mode = st.session_state.get('dashboard_mode', 'Basic')
             is_advanced = current_mode == "Advanced"
             
-            # Simple toggle with no label
+            # Simple toggle with no label - the callback updates the mode before
+            # the rerun, so a click costs one script run instead of two
             try:
-                toggle_state = st.toggle(
+                st.toggle(
                     "",
                     value=is_advanced,
                     key="dashboard_toggle",
-                    label_visibility="collapsed"
+                    label_visibility="collapsed",
+                    on_change=_sync_toggle_state,
+                    args=("dashboard_toggle", "dashboard_mode", "Advanced", "Basic")
                 )
             except AttributeError:
                 # Fallback to checkbox if st.toggle not available
-                toggle_state = st.checkbox(
+                st.checkbox(
                     "",
                     value=is_advanced,
                     key="dashboard_toggle_fallback",
-                    label_visibility="collapsed"
+                    label_visibility="collapsed",
+                    on_change=_sync_toggle_state,
+                    args=("dashboard_toggle_fallback", "dashboard_mode", "Advanced", "Basic")
                 )
-            
-            # Update session state when toggle changes
-            if toggle_state != is_advanced:
-                new_mode = "Advanced" if toggle_state else "Basic"
-                st.session_state.dashboard_mode = new_mode
-                st.rerun()
         
         # Close the mode toggle section
         st.markdown("""</div>""", unsafe_allow_html=True)
@@ -1171,21 +1732,25 @@ def create_sidebar():
             
             # Simple toggle with no label for Telugu/English
             try:
-                language_toggle_state = toggle_container.toggle(
+                toggle_container.toggle(
                     "",
                     value=is_telugu,
                     key="language_toggle",
                     label_visibility="collapsed",
-                    help="OFF: English (translated) comments | ON: Telugu (original) comments"
+                    help="OFF: English (translated) comments | ON: Telugu (original) comments",
+                    on_change=_sync_toggle_state,
+                    args=("language_toggle", "language_mode", "Telugu", "English")
                 )
             except AttributeError:
                 # Fallback to checkbox if st.toggle not available
-                language_toggle_state = toggle_container.checkbox(
+                toggle_container.checkbox(
                     "",
                     value=is_telugu,
                     key="language_toggle_fallback",
                     label_visibility="collapsed",
-                    help="OFF: English (translated) comments | ON: Telugu (original) comments"
+                    help="OFF: English (translated) comments | ON: Telugu (original) comments",
+                    on_change=_sync_toggle_state,
+                    args=("language_toggle_fallback", "language_mode", "Telugu", "English")
                 )
             
             # Show current language mode
@@ -1199,12 +1764,6 @@ def create_sidebar():
                 </span>
             </div>
             """, unsafe_allow_html=True)
-            
-            # Update session state when language toggle changes
-            if language_toggle_state != is_telugu:
-                new_language = "Telugu" if language_toggle_state else "English"
-                st.session_state.language_mode = new_language
-                st.rerun()
         
         # Close the language toggle section
         st.markdown("""</div>""", unsafe_allow_html=True)
@@ -1255,32 +1814,24 @@ def create_sidebar():
             is_active = (page["name"] == st.session_state.current_page)
             button_type = "primary" if is_active else "secondary"
             
-            if st.button(
+            st.button(
                 page["name"],
                 key=f"nav_btn_{page['name']}",
                 type=button_type,
-                use_container_width=True
-            ):
-                st.session_state.current_page = page["name"]
-                st.rerun()
+                use_container_width=True,
+                on_click=_set_current_page,
+                args=(page["name"],)
+            )
 
         # --- 4. REPUTATION SCORE SECTION ---
-        videos_df, comments_df = load_reputation_data()
+        videos_df, comments_df = get_reputation_data()
     
         if not videos_df.empty and not comments_df.empty:
-            reputation_score = calculate_reputation_score(comments_df)
-            sentiment_dist = get_sentiment_distribution(comments_df)
+            summary = get_sentiment_summary(comments_df)
+            reputation_score = summary['reputation_score']
             
             # Status indicator
-            def get_reputation_color_and_text(score):
-                if score >= 70: 
-                    return "#22C55E", "EXCELLENT"
-                elif score >= 50: 
-                    return "#FFA502", "MODERATE"
-                else: 
-                    return "#FF4757", "CRITICAL"
-            
-            status_color, status_text = get_reputation_color_and_text(reputation_score)
+            status_color, status_text = reputation_status(reputation_score, SIDEBAR_REPUTATION_STATUS)
             
             # Main reputation score
             st.markdown(f"""
@@ -1298,12 +1849,11 @@ def create_sidebar():
             </div>
             """, unsafe_allow_html=True)
             
-            # Quick stats using Streamlit metrics
-            st.metric("Videos", len(videos_df))
-            st.metric("Comments", len(comments_df))
-            
-            positive_pct = round((sentiment_dist['Positive'] / sum(sentiment_dist.values())) * 100, 1) if sum(sentiment_dist.values()) > 0 else 0
-            st.metric("Positive", f"{positive_pct}%")
+            # Quick stats using Streamlit metrics, laid out in one row
+            stat_cols = st.columns(3)
+            stat_cols[0].metric("Videos", len(videos_df))
+            stat_cols[1].metric("Comments", len(comments_df))
+            stat_cols[2].metric("Positive", f"{summary['positive_pct']}%")
 
         # --- 5. FOOTER SECTION ---
         st.markdown('<div class="sidebar-footer-spacer"></div>', unsafe_allow_html=True)
@@ -1410,110 +1960,8 @@ def create_top_mode_selector():
     st.markdown("<div style='margin: 0.5rem 0;'></div>", unsafe_allow_html=True)
 
 # PAGE FUNCTIONS
-def show_overview_page():
-    """Enhanced Overview page with executive summary and key metrics"""
-    # Create page header without mode selector since it's now in sidebar
-    st.markdown('<h1 class="page-title">📊 Overview</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="page-subtitle">Real-time intelligence for Sandhya Convention MD Sridhar Rao\'s online reputation</p>', unsafe_allow_html=True)
-    
-    # Load data with language preference support
-    videos_df, comments_df_raw = load_reputation_data()
-    
-    # Apply language preference to comments
-    comments_df = get_language_aware_comments(comments_df_raw)
-    
-    if videos_df.empty or comments_df.empty:
-        st.error("⚠️ No data available. Please check data files.")
-        return
-    
-    # Get AI insights
-    ai_insights = get_ai_insights(videos_df, comments_df)
-    
-    # Calculate core metrics
-    reputation_score = calculate_reputation_score(comments_df)
-    sentiment_dist = get_sentiment_distribution(comments_df)
-    total_comments = sum(sentiment_dist.values())
-    positive_pct = round((sentiment_dist['Positive'] / total_comments) * 100, 1) if total_comments > 0 else 0
-    negative_pct = round((sentiment_dist['Negative'] / total_comments) * 100, 1) if total_comments > 0 else 0
-    total_videos = len(videos_df)
-    
-    # 🎯 REFINED EXECUTIVE STATUS INDICATOR
-    if reputation_score < 30:
-        status_color = "#EF4444"
-        status_icon = "🚨"
-        status_text = "REPUTATION CRISIS"
-        status_bg = "linear-gradient(90deg, rgba(239, 68, 68, 0.05) 0%, rgba(239, 68, 68, 0.01) 100%)"
-    elif reputation_score < 50:
-        status_color = "#F59E0B"
-        status_icon = "⚠️"
-        status_text = "REPUTATION WARNING"
-        status_bg = "linear-gradient(90deg, rgba(245, 158, 11, 0.05) 0%, rgba(245, 158, 11, 0.01) 100%)"
-    elif reputation_score < 70:
-        status_color = "#EAB308"
-        status_icon = "⚖️"
-        status_text = "REPUTATION MODERATE"
-        status_bg = "linear-gradient(90deg, rgba(234, 179, 8, 0.05) 0%, rgba(234, 179, 8, 0.01) 100%)"
-    else:
-        status_color = "#22C55E"
-        status_icon = "✅"
-        status_text = "REPUTATION HEALTHY"
-        status_bg = "linear-gradient(90deg, rgba(34, 197, 94, 0.05) 0%, rgba(34, 197, 94, 0.01) 100%)"
-    
-    # Sleek Executive Status Bar
-    st.markdown(f"""
-    <div style="
-        background: {status_bg};
-        border: 1px solid rgba(64, 64, 64, 0.3);
-        border-left: 3px solid {status_color};
-        border-radius: 12px;
-        padding: 1rem 1.5rem;
-        margin-bottom: 2rem;
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.08);
-    ">
-        <div style="display: flex; align-items: center; gap: 1rem;">
-            <div style="
-                font-size: 1.5rem; 
-                background: rgba(255, 255, 255, 0.06); 
-                padding: 0.4rem; 
-                border-radius: 8px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                width: 48px;
-                height: 48px;
-            ">{status_icon}</div>
-            <div>
-                <div style="color: {status_color}; font-weight: 700; font-size: 1rem; margin-bottom: 0.1rem;">{status_text}</div>
-                <div style="color: #999; font-size: 0.75rem;">Updated: {datetime.now().strftime('%B %d, %Y at %H:%M')}</div>
-            </div>
-        </div>
-        <div style="display: flex; gap: 2rem; font-size: 0.8rem;">
-            <div style="text-align: center;">
-                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">SCORE</div>
-                <div style="color: {status_color}; font-weight: 700; font-size: 1rem;">{reputation_score}%</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">POSITIVE</div>
-                <div style="color: #22C55E; font-weight: 700; font-size: 1rem;">{positive_pct}%</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">NEGATIVE</div>
-                <div style="color: #EF4444; font-weight: 700; font-size: 1rem;">{negative_pct}%</div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # 📊 PREMIUM METRICS GRID
-    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.5rem; font-weight: 600;">🎯 Key Performance Metrics</h2>', unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Enhanced card style with premium effects
-    card_style = """
+# Overview/analytics metric cards - enhanced card style with premium effects
+METRIC_CARD_STYLE = """
         background: linear-gradient(145deg, #2D2D2D 0%, #3A3A3A 50%, #2D2D2D 100%);
         border-radius: 12px;
         padding: 1.5rem 0.8rem;
@@ -1529,63 +1977,25 @@ def show_overview_page():
         overflow: hidden;
         box-shadow: 0 2px 10px rgba(0, 0, 0, 0.08);
     """
-    
-    with col1:
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">🎯</div>
-            <div style="color: {status_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{reputation_score}%</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">REPUTATION SCORE</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">{total_comments:,} comments analyzed</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">📹</div>
-            <div style="color: #FF6348; font-size: 1.8rem; font-weight: 800; line-height: 1;">{total_videos:,}</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">VIDEOS TRACKED</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">{videos_df['Channel'].nunique()} unique channels</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        high_engagement = len(comments_df[comments_df['LikeCount'] > 10]) if 'LikeCount' in comments_df.columns else 0
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">💬</div>
-            <div style="color: #FFA502; font-size: 1.8rem; font-weight: 800; line-height: 1;">{total_comments:,}</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">TOTAL COMMENTS</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">{high_engagement} high-engagement</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        sentiment_color = "#22C55E" if positive_pct > 50 else "#EF4444" if positive_pct < 30 else "#EAB308"
-        st.markdown(f"""
-        <div style="{card_style}" 
+
+METRIC_CARD_TEMPLATE = """
+        <div style="{style}" 
              onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
              onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">😊</div>
-            <div style="color: {sentiment_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{positive_pct}%</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">POSITIVE SENTIMENT</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">Target: >70%</div>
+            <div style="font-size: 2.2rem;">{emoji}</div>
+            <div style="color: {value_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{value}</div>
+            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">{label}</div>
+            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">{subtitle}</div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    # Professional spacing
-    st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
-    
-    # 📈 ANALYTICS SECTION
-    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">📊 Analytics Dashboard</h2>', unsafe_allow_html=True)
-    
+        """
+
+# st.fragment (Streamlit 1.33+) reruns only the decorated block on its own widget
+# changes; on older versions the block simply runs inline with the page
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@_fragment
+def show_overview_charts(videos_df, comments_df):
+    """Overview time period selector with the sentiment timeline and video impact charts"""
     # Time period selector (compact)
     col_filter, col_spacer = st.columns([2, 6])
     with col_filter:
@@ -1596,11 +2006,12 @@ def show_overview_page():
             key="overview_time_period"
         )
     
-    # Filter data based on selected period
+    # Filter data based on selected period - a positional slice, no row copy
+    n_comments = len(comments_df)
     if "30 Days" in time_period:
-        filtered_comments = comments_df.tail(len(comments_df) // 3)
+        filtered_comments = comments_df.iloc[n_comments - n_comments // 3:]
     elif "90 Days" in time_period:
-        filtered_comments = comments_df.tail(len(comments_df) // 2)
+        filtered_comments = comments_df.iloc[n_comments - n_comments // 2:]
     else:
         filtered_comments = comments_df
     
@@ -1610,7 +2021,11 @@ def show_overview_page():
     with col1:
         st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📈 Sentiment Timeline</h3>', unsafe_allow_html=True)
         
-        sentiment_fig = create_sentiment_timeline(filtered_comments)
+        # All Time covers the full dataset, so the offline daily table can stand in for the groupby
+        if "All Time" in time_period:
+            sentiment_fig = create_sentiment_timeline(filtered_comments, daily_sentiment=load_daily_sentiment())
+        else:
+            sentiment_fig = create_sentiment_timeline(filtered_comments)
         sentiment_fig.update_layout(
             height=340, 
             margin=dict(t=10, b=20, l=20, r=20),
@@ -1630,6 +2045,113 @@ def show_overview_page():
             plot_bgcolor='rgba(0,0,0,0)'
         )
         st.plotly_chart(video_fig, use_container_width=True)
+
+def show_overview_page():
+    """Enhanced Overview page with executive summary and key metrics"""
+    # Create page header without mode selector since it's now in sidebar
+    st.markdown('<h1 class="page-title">📊 Overview</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="page-subtitle">Real-time intelligence for Sandhya Convention MD Sridhar Rao\'s online reputation</p>', unsafe_allow_html=True)
+    
+    # Load data with language preference support
+    videos_df, comments_df_raw = get_reputation_data()
+    
+    # Apply language preference to comments
+    comments_df = get_language_aware_comments(comments_df_raw)
+    
+    if videos_df.empty or comments_df.empty:
+        st.error("⚠️ No data available. Please check data files.")
+        return
+    
+    # Calculate core metrics - each column is scanned once, before any rendering
+    summary = get_sentiment_summary(comments_df)
+    reputation_score = summary['reputation_score']
+    total_comments = summary['total_comments']
+    positive_pct = summary['positive_pct']
+    negative_pct = summary['negative_pct']
+    total_videos = len(videos_df)
+    unique_channels = videos_df['Channel'].nunique()
+    # Count the mask directly rather than materialising the matching rows (NaN compares False)
+    high_engagement = int(np.count_nonzero(comments_df['LikeCount'].to_numpy() > 10)) if 'LikeCount' in comments_df.columns else 0
+    
+    # 🎯 REFINED EXECUTIVE STATUS INDICATOR
+    status_color, status_icon, status_text, status_bg = reputation_status(reputation_score, OVERVIEW_REPUTATION_STATUS)
+    
+    # Sleek Executive Status Bar
+    st.markdown(f"""
+    <div style="
+        background: {status_bg};
+        border: 1px solid rgba(64, 64, 64, 0.3);
+        border-left: 3px solid {status_color};
+        border-radius: 12px;
+        padding: 1rem 1.5rem;
+        margin-bottom: 2rem;
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.08);
+    ">
+        <div style="display: flex; align-items: center; gap: 1rem;">
+            <div style="
+                font-size: 1.5rem; 
+                background: rgba(255, 255, 255, 0.06); 
+                padding: 0.4rem; 
+                border-radius: 8px;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                width: 48px;
+                height: 48px;
+            ">{status_icon}</div>
+            <div>
+                <div style="color: {status_color}; font-weight: 700; font-size: 1rem; margin-bottom: 0.1rem;">{status_text}</div>
+                <div style="color: #999; font-size: 0.75rem;">Updated: {datetime.now().strftime('%B %d, %Y at %H:%M')}</div>
+            </div>
+        </div>
+        <div style="display: flex; gap: 2rem; font-size: 0.8rem;">
+            <div style="text-align: center;">
+                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">SCORE</div>
+                <div style="color: {status_color}; font-weight: 700; font-size: 1rem;">{reputation_score}%</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">POSITIVE</div>
+                <div style="color: #22C55E; font-weight: 700; font-size: 1rem;">{positive_pct}%</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="color: #999; font-size: 0.7rem; margin-bottom: 0.1rem;">NEGATIVE</div>
+                <div style="color: #EF4444; font-weight: 700; font-size: 1rem;">{negative_pct}%</div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 📊 PREMIUM METRICS GRID
+    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.5rem; font-weight: 600;">🎯 Key Performance Metrics</h2>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    overview_cards = [
+        {"emoji": "🎯", "value_color": status_color, "value": f"{reputation_score}%",
+         "label": "REPUTATION SCORE", "subtitle": f"{total_comments:,} comments analyzed"},
+        {"emoji": "📹", "value_color": "#FF6348", "value": f"{total_videos:,}",
+         "label": "VIDEOS TRACKED", "subtitle": f"{unique_channels} unique channels"},
+        {"emoji": "💬", "value_color": "#FFA502", "value": f"{total_comments:,}",
+         "label": "TOTAL COMMENTS", "subtitle": f"{high_engagement} high-engagement"},
+        {"emoji": "😊", "value_color": "#22C55E" if positive_pct > 50 else "#EF4444" if positive_pct < 30 else "#EAB308",
+         "value": f"{positive_pct}%", "label": "POSITIVE SENTIMENT", "subtitle": "Target: >70%"}
+    ]
+    
+    for col, card in zip((col1, col2, col3, col4), overview_cards):
+        with col:
+            st.markdown(METRIC_CARD_TEMPLATE.format_map({"style": METRIC_CARD_STYLE, **card}), unsafe_allow_html=True)
+    
+    # Professional spacing
+    st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
+    
+    # 📈 ANALYTICS SECTION
+    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">📊 Analytics Dashboard</h2>', unsafe_allow_html=True)
+    
+    # Time period selector and charts - a fragment where supported, so changing the period reruns only this block
+    show_overview_charts(videos_df, comments_df)
     
     # Professional spacing
     st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
@@ -1675,7 +2197,7 @@ def show_overview_page():
                 </div>
                 <div style="margin-bottom: 0.8rem;">
                     <strong style="color: #FFA502;">Media Coverage</strong><br>
-                    {total_videos} videos across {videos_df['Channel'].nunique()} channels
+                    {total_videos} videos across {unique_channels} channels
                 </div>
                 <div>
                     <strong style="color: #FFA502;">Engagement Level</strong><br>
@@ -1738,12 +2260,64 @@ def show_overview_page():
         </div>
         """, unsafe_allow_html=True)
 
+@st.cache_data(ttl="15m", max_entries=16, show_spinner=False)
+def build_insights_html(reputation_score, positive_pct, engagement_rate):
+    """Key insight cards as one HTML blob; cached on the three driver metrics"""
+    insights = []
+    
+    if reputation_score >= 70:
+        insights.append(("✅ Strong Reputation", f"Reputation score of {reputation_score:.1f}% indicates excellent public perception.", "#22C55E"))
+    elif reputation_score >= 50:
+        insights.append(("⚠️ Moderate Reputation", f"Reputation score of {reputation_score:.1f}% has room for improvement.", "#FFA502"))
+    else:
+        insights.append(("🚨 Reputation Alert", f"Reputation score of {reputation_score:.1f}% requires immediate attention.", "#EF4444"))
+    
+    if positive_pct >= 60:
+        insights.append(("😊 Positive Sentiment", f"{positive_pct}% positive sentiment shows strong public support.", "#22C55E"))
+    elif positive_pct >= 40:
+        insights.append(("😐 Mixed Sentiment", f"{positive_pct}% positive sentiment indicates balanced opinions.", "#FFA502"))
+    else:
+        insights.append(("😞 Negative Sentiment", f"Only {positive_pct}% positive sentiment needs strategic response.", "#EF4444"))
+    
+    if engagement_rate >= 10:
+        insights.append(("🔥 High Engagement", f"{engagement_rate:.1f}% engagement rate shows active audience interaction.", "#22C55E"))
+    elif engagement_rate >= 5:
+        insights.append(("📈 Moderate Engagement", f"{engagement_rate:.1f}% engagement rate has potential for growth.", "#FFA502"))
+    else:
+        insights.append(("📉 Low Engagement", f"{engagement_rate:.1f}% engagement rate needs improvement strategies.", "#EF4444"))
+    
+    # One grid of cards, rendered with a single markdown call
+    insight_html = ''.join(f"""
+            <div style="
+                background: rgba(45, 45, 45, 0.3); 
+                padding: 1.5rem; 
+                border-radius: 12px; 
+                border-left: 4px solid {color};
+                border: 1px solid #404040;
+                height: 120px;
+                display: flex;
+                flex-direction: column;
+                justify-content: center;
+            ">
+                <div style="color: {color}; font-weight: 700; font-size: 0.9rem; margin-bottom: 0.5rem;">{title}</div>
+                <div style="color: #CCCCCC; font-size: 0.8rem; line-height: 1.4;">{description}</div>
+            </div>
+            """.strip() for title, description, color in insights)
+    return f'<div style="display: grid; grid-template-columns: repeat({len(insights)}, 1fr); gap: 1rem;">{insight_html}</div>'
+
+@_fragment
+def show_analytics_insights(reputation_score, positive_pct, engagement_rate):
+    """Analytics key insights section"""
+    st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
+    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">💡 Key Insights & Recommendations</h2>', unsafe_allow_html=True)
+    st.markdown(build_insights_html(reputation_score, positive_pct, engagement_rate), unsafe_allow_html=True)
+
 def show_analytics_page():
     """Enhanced Analytics page with comprehensive intelligence and insights"""
     st.markdown('<h1 class="page-title">📈 Analytics</h1>', unsafe_allow_html=True)
     st.markdown('<p class="page-subtitle">Advanced analytics, sentiment intelligence, and strategic insights for Sridhar Rao</p>', unsafe_allow_html=True)
     
-    videos_df, comments_df_raw = load_reputation_data()
+    videos_df, comments_df_raw = get_reputation_data()
     
     # Apply language preference to comments
     comments_df = get_language_aware_comments(comments_df_raw)
@@ -1752,97 +2326,49 @@ def show_analytics_page():
         st.error("No analytics data available")
         return
     
-    # Calculate comprehensive metrics
-    total_comments = len(comments_df)
+    # Calculate comprehensive metrics (the sentiment summary is shared with the sidebar)
+    kpis = compute_analytics_kpis(comments_df)
+    total_comments = kpis['total_comments']
     total_videos = len(videos_df)
-    sentiment_dist = get_sentiment_distribution(comments_df)
-    reputation_score = calculate_reputation_score(comments_df)
-    avg_sentiment = comments_df['Sentiment'].mean() if 'Sentiment' in comments_df.columns else 0
+    sentiment_dist = kpis['sentiment_dist']
+    reputation_score = kpis['reputation_score']
+    avg_sentiment = kpis['avg_sentiment']
     
     # Calculate engagement metrics
-    total_likes = comments_df['LikeCount'].sum() if 'LikeCount' in comments_df.columns else 0
-    avg_likes = comments_df['LikeCount'].mean() if 'LikeCount' in comments_df.columns else 0
-    engagement_rate = (total_likes / total_comments * 100) if total_comments > 0 else 0
+    avg_likes = kpis['avg_likes']
+    engagement_rate = kpis['engagement_rate']
+    sentiment_std = kpis['sentiment_std']
     
     # 📊 ANALYTICS PERFORMANCE METRICS
     st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">📊 Analytics Performance Metrics</h2>', unsafe_allow_html=True)
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Enhanced card style - consistent with other pages
-    card_style = """
-        background: linear-gradient(145deg, #2D2D2D 0%, #3A3A3A 50%, #2D2D2D 100%);
-        border-radius: 12px;
-        padding: 1.5rem 0.8rem;
-        border: 1px solid #404040;
-        text-align: center;
-        height: 180px;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-evenly;
-        align-items: center;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.08);
-    """
-    
-    with col1:
-        # Reputation score with dynamic color
-        rep_color = "#22C55E" if reputation_score >= 70 else "#FFA502" if reputation_score >= 50 else "#EF4444"
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">🎯</div>
-            <div style="color: {rep_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{reputation_score:.1f}%</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">REPUTATION SCORE</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">Overall rating</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Sentiment score with dynamic color
-        sentiment_color = "#22C55E" if avg_sentiment >= 0.1 else "#FFA502" if avg_sentiment >= -0.1 else "#EF4444"
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">📊</div>
-            <div style="color: {sentiment_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{avg_sentiment:.2f}</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">AVG SENTIMENT</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">Mood indicator</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        # Engagement rate
-        engagement_color = "#22C55E" if engagement_rate >= 10 else "#FFA502" if engagement_rate >= 5 else "#EF4444"
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">🔥</div>
-            <div style="color: {engagement_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{engagement_rate:.1f}%</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">ENGAGEMENT RATE</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">Interaction level</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        # Content coverage
-        coverage_score = min(100, (total_videos / 50) * 100) if total_videos > 0 else 0  # Assuming 50 videos is good coverage
-        coverage_color = "#22C55E" if coverage_score >= 80 else "#FFA502" if coverage_score >= 50 else "#EF4444"
-        st.markdown(f"""
-        <div style="{card_style}" 
-             onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 4px 15px rgba(255, 71, 87, 0.1)'; this.style.borderColor='#FF4757';" 
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 10px rgba(0, 0, 0, 0.08)'; this.style.borderColor='#404040';">
-            <div style="font-size: 2.2rem;">📺</div>
-            <div style="color: {coverage_color}; font-size: 1.8rem; font-weight: 800; line-height: 1;">{coverage_score:.0f}%</div>
-            <div style="color: #CCCCCC; font-size: 0.8rem; font-weight: 600; letter-spacing: 0.3px;">CONTENT COVERAGE</div>
-            <div style="color: #888; font-size: 0.65rem; opacity: 0.8;">Media presence</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Dynamic colours for each card
+    rep_color = tri_color(reputation_score, 50, 70)
+    sentiment_color = tri_color(avg_sentiment, -0.1, 0.1)
+    engagement_color = tri_color(engagement_rate, 5, 10)
+    coverage_score = min(100, (total_videos / 50) * 100) if total_videos > 0 else 0  # Assuming 50 videos is good coverage
+    coverage_color = tri_color(coverage_score, 50, 80)
+    
+    analytics_cards = [
+        {"emoji": "🎯", "value_color": rep_color, "value": f"{reputation_score:.1f}%",
+         "label": "REPUTATION SCORE", "subtitle": "Overall rating"},
+        {"emoji": "📊", "value_color": sentiment_color, "value": f"{avg_sentiment:.2f}",
+         "label": "AVG SENTIMENT", "subtitle": "Mood indicator"},
+        {"emoji": "🔥", "value_color": engagement_color, "value": f"{engagement_rate:.1f}%",
+         "label": "ENGAGEMENT RATE", "subtitle": "Interaction level"},
+        {"emoji": "📺", "value_color": coverage_color, "value": f"{coverage_score:.0f}%",
+         "label": "CONTENT COVERAGE", "subtitle": "Media presence"}
+    ]
+    
+    # All four cards in one grid and one markdown call (stripped so no blank line ends the HTML block)
+    cards_html = ''.join(
+        METRIC_CARD_TEMPLATE.format_map({"style": METRIC_CARD_STYLE, **card}).strip()
+        for card in analytics_cards
+    )
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{cards_html}</div>',
+        unsafe_allow_html=True
+    )
     
     # Professional spacing
     st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
@@ -1881,45 +2407,20 @@ def show_analytics_page():
             showlegend=True
         )
         
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📈 Sentiment Timeline</h3>', unsafe_allow_html=True)
-        
-        # Create enhanced sentiment timeline
-        if 'Date' in comments_df.columns and 'Sentiment' in comments_df.columns:
-            comments_df_copy = comments_df.copy()
-            comments_df_copy['Date'] = pd.to_datetime(comments_df_copy['Date'])
-            
-            # Group by date and calculate daily sentiment
-            daily_sentiment = comments_df_copy.groupby(comments_df_copy['Date'].dt.date)['Sentiment'].mean().reset_index()
-            daily_sentiment['Date'] = pd.to_datetime(daily_sentiment['Date'])
-            
-            fig = go.Figure()
-            
-            # Use dynamic color based on sentiment value
-            sentiment_colors = ['#EF4444' if s < -0.1 else '#22C55E' if s > 0.1 else '#FFA502' for s in daily_sentiment['Sentiment']]
-            
-            fig.add_trace(go.Scatter(
-                x=daily_sentiment['Date'],
-                y=daily_sentiment['Sentiment'],
-                mode='lines+markers',
-                line=dict(color='#FF6348', width=3),
-                marker=dict(size=8, color=sentiment_colors),
-                hovertemplate='<b>%{x}</b><br>Sentiment: %{y:.2f}<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                height=300,
-                margin=dict(t=10, b=20, l=20, r=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis=dict(gridcolor='#404040', title="Date"),
-                yaxis=dict(gridcolor='#404040', title="Sentiment"),
-                showlegend=False
-            )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📈 Sentiment Timeline</h3>', unsafe_allow_html=True)
+        
+        # Create enhanced sentiment timeline
+        if 'Date' in comments_df.columns and 'Sentiment' in comments_df.columns:
+            # Daily sentiment from the shared per-day table
+            daily_sentiment = get_daily_analytics(comments_df)['daily']
             
+            fig = build_analytics_sentiment_figure(
+                daily_sentiment['Date'].to_numpy(dtype='datetime64[ns]'),
+                daily_sentiment['Sentiment'].to_numpy(dtype=np.float64)
+            )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Timeline data not available")
@@ -1937,34 +2438,8 @@ def show_analytics_page():
     with col1:
         if text_data and len(text_data.strip()) > 10:
             try:
-                # Create word cloud - 50% smaller as requested
-                wordcloud = WordCloud(
-                    width=300,  # Reduced by 50% from 600
-                    height=150,  # Reduced by 50% from 300
-                    background_color='black',
-                    colormap='Reds',
-                    max_words=100,
-                    prefer_horizontal=0.7,
-                    relative_scaling=0.5
-                ).generate(text_data)
-                
-                # Create matplotlib figure - 50% smaller
-                fig, ax = plt.subplots(figsize=(4, 2))  # Reduced from (8, 4)
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                
-                # Set black background and border
-                fig.patch.set_facecolor('black')
-                ax.set_facecolor('black')
-                
-                # Add black border around the plot
-                for spine in ax.spines.values():
-                    spine.set_edgecolor('black')
-                    spine.set_linewidth(3)
-                
-                plt.tight_layout(pad=0)
-                
-                st.pyplot(fig)
+                # Create word cloud - 50% smaller as requested (300x150, down from 600x300)
+                st.image(render_wordcloud_png(text_data, 300, 150), use_column_width=True)
                 
             except Exception as e:
                 st.error(f"Error generating word cloud: {e}")
@@ -1975,13 +2450,10 @@ def show_analytics_page():
         st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">🏆 Top Keywords</h3>', unsafe_allow_html=True)
         
         if text_data and len(text_data.strip()) > 10:
-            words = text_data.split()
-            word_freq = Counter(words)
-            top_words = word_freq.most_common(10)
+            top_words = get_word_frequencies(text_data)[:10]
             
-            # Display top keywords in a clean list
-            for i, (word, freq) in enumerate(top_words):
-                st.markdown(f"""
+            # Display top keywords in a clean list - one markdown call for all of them
+            keyword_html = ''.join(f"""
                 <div style="
                     background: rgba(45, 45, 45, 0.3); 
                     padding: 0.5rem 1rem; 
@@ -1994,7 +2466,8 @@ def show_analytics_page():
                         <span style="color: #FF4757; font-weight: 700;">{freq}</span>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
+                """.strip() for i, (word, freq) in enumerate(top_words))
+            st.markdown(keyword_html, unsafe_allow_html=True)
         else:
             st.info("No keyword data available")
     
@@ -2010,41 +2483,19 @@ def show_analytics_page():
         st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📅 Engagement Over Time</h3>', unsafe_allow_html=True)
         
         if 'Date' in comments_df.columns and 'LikeCount' in comments_df.columns:
-            # Create engagement timeline
-            comments_df_copy = comments_df.copy()
-            comments_df_copy['Date'] = pd.to_datetime(comments_df_copy['Date'])
-            
-            # Group by date and calculate engagement metrics
-            daily_engagement = comments_df_copy.groupby(comments_df_copy['Date'].dt.date).agg({
-                'LikeCount': 'sum',
-                'Comment': 'count'
-            }).reset_index()
-            daily_engagement['Date'] = pd.to_datetime(daily_engagement['Date'])
-            daily_engagement['EngagementRate'] = (daily_engagement['LikeCount'] / daily_engagement['Comment'] * 100).fillna(0)
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=daily_engagement['Date'],
-                y=daily_engagement['EngagementRate'],
-                mode='lines+markers',
-                line=dict(color='#FFA502', width=3),
-                marker=dict(size=6, color='#FFA502'),
-                name='Engagement Rate %',
-                hovertemplate='<b>%{x}</b><br>Engagement: %{y:.1f}%<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                height=300,
-                margin=dict(t=10, b=20, l=20, r=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis=dict(gridcolor='#404040', title="Date"),
-                yaxis=dict(gridcolor='#404040', title="Engagement Rate (%)"),
-                showlegend=False
+            # Create engagement timeline from the shared per-day table
+            daily_engagement = get_daily_analytics(comments_df)['daily']
+            likes = daily_engagement['LikeCount'].to_numpy(dtype=np.float64)
+            counts = daily_engagement['Comment'].to_numpy()
+            # Days without a counted comment get a 0% rate instead of NaN/inf
+            daily_rate = np.zeros_like(likes)
+            np.divide(likes, counts, out=daily_rate, where=counts > 0)
+            daily_rate *= 100
+            
+            fig = build_engagement_figure(
+                daily_engagement['Date'].to_numpy(dtype='datetime64[ns]'),
+                daily_rate
             )
-            
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Engagement data not available")
@@ -2054,29 +2505,14 @@ def show_analytics_page():
         
         if 'Date' in comments_df.columns:
             # Create sentiment trend analysis
-            comments_df_copy = comments_df.copy()
-            comments_df_copy['Date'] = pd.to_datetime(comments_df_copy['Date'])
-            
             # Safe column checking for sentiment data
-            if 'SentLabel' in comments_df_copy.columns:
-                # Group by date and sentiment
-                sentiment_by_date = comments_df_copy.groupby(['Date', 'SentLabel']).size().unstack(fill_value=0).reset_index()
-                sentiment_by_date['Date'] = pd.to_datetime(sentiment_by_date['Date'])
+            if 'SentLabel' in comments_df.columns:
+                # Per-day label counts from the shared table
+                sentiment_by_date = get_daily_analytics(comments_df)['labels'].rename_axis('Date').reset_index()
                 
                 fig = go.Figure()
                 
-                colors = {'Positive': '#22C55E', 'Neutral': '#9CA3AF', 'Negative': '#EF4444'}
-                
-                for sentiment in ['Positive', 'Neutral', 'Negative']:
-                    if sentiment in sentiment_by_date.columns:
-                        fig.add_trace(go.Scatter(
-                            x=sentiment_by_date['Date'],
-                            y=sentiment_by_date[sentiment],
-                            mode='lines+markers',
-                            name=sentiment,
-                            line=dict(width=2, color=colors[sentiment]),
-                            marker=dict(size=4, color=colors[sentiment])
-                        ))
+                add_label_count_traces(fig, sentiment_by_date['Date'], sentiment_by_date, line_width=2, marker_size=4)
                 
                 fig.update_layout(
                     height=300,
@@ -2092,33 +2528,22 @@ def show_analytics_page():
                 
                 st.plotly_chart(fig, use_container_width=True)
                 
-            elif 'Sentiment' in comments_df_copy.columns:
+            elif 'Sentiment' in comments_df.columns:
                 # Use numeric sentiment values with categorization
                 st.info("Using numeric sentiment analysis (SentLabel column not found)")
                 
                 # Create sentiment categories
-                comments_df_copy['SentimentCategory'] = comments_df_copy['Sentiment'].apply(
-                    lambda x: 'Positive' if x > 0.1 else 'Negative' if x < -0.1 else 'Neutral'
+                sentiment_category = pd.Series(
+                    categorize_sentiment(comments_df['Sentiment'].to_numpy()),
+                    index=comments_df.index, name='SentimentCategory'
                 )
                 
                 # Group by date and sentiment category
-                sentiment_by_date = comments_df_copy.groupby(['Date', 'SentimentCategory']).size().unstack(fill_value=0).reset_index()
-                sentiment_by_date['Date'] = pd.to_datetime(sentiment_by_date['Date'])
+                sentiment_by_date = comments_df.groupby([comments_df['DateOnly'], sentiment_category], observed=True).size().unstack(fill_value=0).reindex(columns=SENTIMENT_LABELS, fill_value=0).rename_axis('Date').reset_index()
                 
                 fig = go.Figure()
                 
-                colors = {'Positive': '#22C55E', 'Neutral': '#9CA3AF', 'Negative': '#EF4444'}
-                
-                for sentiment in ['Positive', 'Neutral', 'Negative']:
-                    if sentiment in sentiment_by_date.columns:
-                        fig.add_trace(go.Scatter(
-                            x=sentiment_by_date['Date'],
-                            y=sentiment_by_date[sentiment],
-                            mode='lines+markers',
-                            name=sentiment,
-                            line=dict(width=2, color=colors[sentiment]),
-                            marker=dict(size=4, color=colors[sentiment])
-                        ))
+                add_label_count_traces(fig, sentiment_by_date['Date'], sentiment_by_date, line_width=2, marker_size=4)
                 
                 fig.update_layout(
                     height=300,
@@ -2139,54 +2564,8 @@ def show_analytics_page():
             st.info("Trend data not available")
     
     # 💡 KEY INSIGHTS SECTION
-    st.markdown("<div style='margin: 2.2rem 0 1.4rem 0;'></div>", unsafe_allow_html=True)
-    st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">💡 Key Insights & Recommendations</h2>', unsafe_allow_html=True)
-    
-    # Generate insights based on data
-    insights = []
-    
-    if reputation_score >= 70:
-        insights.append(("✅ Strong Reputation", f"Reputation score of {reputation_score:.1f}% indicates excellent public perception.", "#22C55E"))
-    elif reputation_score >= 50:
-        insights.append(("⚠️ Moderate Reputation", f"Reputation score of {reputation_score:.1f}% has room for improvement.", "#FFA502"))
-    else:
-        insights.append(("🚨 Reputation Alert", f"Reputation score of {reputation_score:.1f}% requires immediate attention.", "#EF4444"))
-    
     positive_pct = round((sentiment_dist['Positive'] / total_comments) * 100, 1) if total_comments > 0 else 0
-    if positive_pct >= 60:
-        insights.append(("😊 Positive Sentiment", f"{positive_pct}% positive sentiment shows strong public support.", "#22C55E"))
-    elif positive_pct >= 40:
-        insights.append(("😐 Mixed Sentiment", f"{positive_pct}% positive sentiment indicates balanced opinions.", "#FFA502"))
-    else:
-        insights.append(("😞 Negative Sentiment", f"Only {positive_pct}% positive sentiment needs strategic response.", "#EF4444"))
-    
-    if engagement_rate >= 10:
-        insights.append(("🔥 High Engagement", f"{engagement_rate:.1f}% engagement rate shows active audience interaction.", "#22C55E"))
-    elif engagement_rate >= 5:
-        insights.append(("📈 Moderate Engagement", f"{engagement_rate:.1f}% engagement rate has potential for growth.", "#FFA502"))
-    else:
-        insights.append(("📉 Low Engagement", f"{engagement_rate:.1f}% engagement rate needs improvement strategies.", "#EF4444"))
-    
-    # Display insights in cards
-    cols = st.columns(len(insights))
-    for i, (title, description, color) in enumerate(insights):
-        with cols[i]:
-            st.markdown(f"""
-            <div style="
-                background: rgba(45, 45, 45, 0.3); 
-                padding: 1.5rem; 
-                border-radius: 12px; 
-                border-left: 4px solid {color};
-                border: 1px solid #404040;
-                height: 120px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            ">
-                <div style="color: {color}; font-weight: 700; font-size: 0.9rem; margin-bottom: 0.5rem;">{title}</div>
-                <div style="color: #CCCCCC; font-size: 0.8rem; line-height: 1.4;">{description}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    show_analytics_insights(reputation_score, positive_pct, engagement_rate)
 
     # 🧠 ADVANCED MODE FEATURES
     if st.session_state.dashboard_mode == "Advanced":
@@ -2201,57 +2580,18 @@ def show_analytics_page():
             
             if text_data and len(text_data.strip()) > 10:
                 try:
-                    import matplotlib
-                    matplotlib.use('Agg')  # Use non-interactive backend
-                    
-                    # Create word cloud
-                    wordcloud = WordCloud(
-                        width=600,
-                        height=300,
-                        background_color='black',
-                        colormap='Reds',
-                        max_words=100,
-                        prefer_horizontal=0.7,
-                        relative_scaling=0.5
-                    ).generate(text_data)
-                    
-                    # Create matplotlib figure with black background and border
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    
-                    # Set black background and border
-                    fig.patch.set_facecolor('black')
-                    ax.set_facecolor('black')
+                    # Counted once and shared with the top keywords below
+                    word_freq = get_word_frequencies(text_data)
                     
-                    # Add black border around the plot
-                    for spine in ax.spines.values():
-                        spine.set_edgecolor('black')
-                        spine.set_linewidth(3)
+                    # Create word cloud (cached PNG, same counts as the basic section)
+                    wordcloud_png = render_wordcloud_png(text_data, 600, 300)
                     
-                    plt.tight_layout(pad=0)
-                    
-                    # Display in container with black border
-                    st.markdown("""
-                    <div style="
-                        background: black; 
-                        border: 3px solid black; 
-                        border-radius: 8px; 
-                        padding: 1rem;
-                        margin: 1rem 0;
-                    ">
-                    """, unsafe_allow_html=True)
-                    
-                    st.pyplot(fig)
-                    plt.close(fig)  # Close figure to free memory
-                    
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    # The PNG already has a black background - no wrapper element needed
+                    st.image(wordcloud_png, use_column_width=True)
                     
                     # Top keywords in two columns
                     st.markdown("### 🏆 Top Keywords")
-                    words = text_data.split()
-                    word_freq = Counter(words)
-                    top_words = word_freq.most_common(20)
+                    top_words = word_freq[:20]
                     
                     # Create two columns for keywords
                     col1, col2 = st.columns(2)
@@ -2276,7 +2616,7 @@ def show_analytics_page():
         
         # Try to load ML predictions
         try:
-            predictions = load_phase3c_predictions()
+            predictions = get_phase3c_predictions()
             if predictions:
                 col1, col2 = st.columns(2)
                 
@@ -2321,7 +2661,7 @@ def show_analytics_page():
             # Engagement Rate
             try:
                 if 'LikeCount' in comments_df.columns:
-                    avg_likes = comments_df['LikeCount'].mean()
+                    # Same cached reduction as the headline KPI cards
                     st.metric(
                         "Average Engagement",
                         f"{avg_likes:.1f}",
@@ -2336,8 +2676,9 @@ def show_analytics_page():
             # Comment Velocity
             try:
                 if 'Date' in comments_df.columns and len(comments_df) > 10:
-                    recent_comments = len(comments_df.tail(int(len(comments_df) * 0.1)))
-                    velocity = recent_comments / max(1, int(len(comments_df) * 0.1))
+                    # The most recent tenth of the comments - its size needs no slice
+                    recent_comments = int(len(comments_df) * 0.1)
+                    velocity = recent_comments / max(1, recent_comments)
                     st.metric(
                         "Comment Velocity",
                         f"{velocity:.2f}",
@@ -2352,7 +2693,6 @@ def show_analytics_page():
             # Sentiment Consistency
             try:
                 if len(comments_df) > 0 and 'Sentiment' in comments_df.columns:
-                    sentiment_std = comments_df['Sentiment'].std()
                     consistency = max(0, 1 - sentiment_std) * 100
                     st.metric(
                         "Sentiment Consistency",
@@ -2373,33 +2713,16 @@ def show_analytics_page():
                 st.markdown("### 📅 Sentiment Timeline by Day")
                 
                 try:
-                    # Create date-based grouping
-                    comments_df_copy = comments_df.copy()
-                    comments_df_copy['Date'] = pd.to_datetime(comments_df_copy['Date'], errors='coerce')
-                    comments_df_copy['DateOnly'] = comments_df_copy['Date'].dt.date
-                    comments_df_copy['Hour'] = comments_df_copy['Date'].dt.hour
-                    
+                    # Date-based grouping uses the DateOnly column parsed once at load
                     # Check if SentLabel exists, if not use Sentiment for grouping
-                    if 'SentLabel' in comments_df_copy.columns:
-                        # Group by date and sentiment label
-                        sentiment_by_date = comments_df_copy.groupby(['DateOnly', 'SentLabel']).size().unstack(fill_value=0)
+                    if 'SentLabel' in comments_df.columns:
+                        # Per-day label counts - the same table the basic trends chart used
+                        sentiment_by_date = get_daily_analytics(comments_df)['labels']
                         
                         if not sentiment_by_date.empty:
                             fig = go.Figure()
                             
-                            dates = sentiment_by_date.index
-                            colors = {'Positive': '#22C55E', 'Neutral': '#9CA3AF', 'Negative': '#EF4444'}
-                            
-                            for sentiment in ['Positive', 'Neutral', 'Negative']:
-                                if sentiment in sentiment_by_date.columns:
-                                    fig.add_trace(go.Scatter(
-                                        x=dates,
-                                        y=sentiment_by_date[sentiment],
-                                        mode='lines+markers',
-                                        name=sentiment,
-                                        line=dict(width=3, color=colors[sentiment]),
-                                        marker=dict(size=6, color=colors[sentiment])
-                                    ))
+                            add_label_count_traces(fig, sentiment_by_date.index, sentiment_by_date, line_width=3, marker_size=6)
                             
                             fig.update_layout(
                                 title="Daily Sentiment Counts Over Time",
@@ -2415,33 +2738,22 @@ def show_analytics_page():
                         else:
                             st.info("No sentiment timeline data available")
                     
-                    elif 'Sentiment' in comments_df_copy.columns:
+                    elif 'Sentiment' in comments_df.columns:
                         # Use numeric sentiment values instead
                         st.info("Using numeric sentiment analysis (SentLabel column not found)")
                         
                         # Group by date and create sentiment ranges
-                        comments_df_copy['SentimentCategory'] = comments_df_copy['Sentiment'].apply(
-                            lambda x: 'Positive' if x > 0.1 else 'Negative' if x < -0.1 else 'Neutral'
+                        sentiment_category = pd.Series(
+                            categorize_sentiment(comments_df['Sentiment'].to_numpy()),
+                            index=comments_df.index, name='SentimentCategory'
                         )
                         
-                        sentiment_by_date = comments_df_copy.groupby(['DateOnly', 'SentimentCategory']).size().unstack(fill_value=0)
+                        sentiment_by_date = comments_df.groupby([comments_df['DateOnly'], sentiment_category], observed=True).size().unstack(fill_value=0).reindex(columns=SENTIMENT_LABELS, fill_value=0)
                         
                         if not sentiment_by_date.empty:
                             fig = go.Figure()
                             
-                            dates = sentiment_by_date.index
-                            colors = {'Positive': '#22C55E', 'Neutral': '#9CA3AF', 'Negative': '#EF4444'}
-                            
-                            for sentiment in ['Positive', 'Neutral', 'Negative']:
-                                if sentiment in sentiment_by_date.columns:
-                                    fig.add_trace(go.Scatter(
-                                        x=dates,
-                                        y=sentiment_by_date[sentiment],
-                                        mode='lines+markers',
-                                        name=sentiment,
-                                        line=dict(width=3, color=colors[sentiment]),
-                                        marker=dict(size=6, color=colors[sentiment])
-                                    ))
+                            add_label_count_traces(fig, sentiment_by_date.index, sentiment_by_date, line_width=3, marker_size=6)
                             
                             fig.update_layout(
                                 title="Daily Sentiment Counts Over Time",
@@ -2467,13 +2779,203 @@ def show_analytics_page():
         else:
             st.warning("No comment data available for advanced visualizations")
 
+@st.cache_data(ttl="15m", max_entries=4, show_spinner=False)
+def monthly_upload_counts(upload_dates):
+    """('YYYY-MM' labels, upload counts) per calendar month; cached on the date array"""
+    # Month buckets straight from datetime64 - no Period objects, no groupby
+    months = upload_dates[~np.isnat(upload_dates)].astype('datetime64[M]')
+    months, counts = np.unique(months, return_counts=True)
+    return np.datetime_as_string(months, unit='M'), counts
+
+# Video gallery card styles, whitespace-collapsed once at import. Still sent on
+# every rerun - Streamlit drops elements a rerun does not re-send
+_VIDEO_CARD_CSS = re.sub(r'\s+', ' ', """
+    <style>
+    .video-card {
+        background: linear-gradient(135deg, #2D2D2D 0%, #3A3A3A 100%);
+        border-radius: 12px;
+        padding: 1rem;
+        border: 1px solid #404040;
+        transition: all 0.3s ease;
+        height: 100%;
+        display: flex;
+        flex-direction: column;
+    }
+
+    .video-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 8px 25px rgba(255, 71, 87, 0.25);
+        border-color: #FF4757;
+        cursor: pointer !important;
+        background: linear-gradient(135deg, #3A3A3A 0%, #404040 100%);
+    }
+
+    .video-thumbnail {
+        width: 100%;
+        height: 180px;
+        background: linear-gradient(45deg, #FF4757, #FF6348);
+        border-radius: 8px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        margin-bottom: 1rem;
+        position: relative;
+        overflow: hidden;
+    }
+
+    .video-thumbnail img {
+        width: 100%;
+        height: 100%;
+        object-fit: cover;
+        border-radius: 8px;
+    }
+
+    .video-title {
+        color: white;
+        font-size: 1rem;
+        font-weight: 600;
+        line-height: 1.4;
+        margin-bottom: 0.5rem;
+        display: -webkit-box;
+        -webkit-line-clamp: 2;
+        -webkit-box-orient: vertical;
+        overflow: hidden;
+        flex-grow: 1;
+    }
+
+    .video-channel {
+        color: #999;
+        font-size: 0.85rem;
+        margin-bottom: 0.75rem;
+    }
+
+    .video-stats {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        font-size: 0.75rem;
+        color: #CCCCCC;
+        margin-top: auto;
+        padding-top: 0.5rem;
+        border-top: 1px solid #404040;
+    }
+
+    .video-stat {
+        display: flex;
+        align-items: center;
+        gap: 0.25rem;
+    }
+
+    .video-date {
+        color: #999;
+        font-size: 0.7rem;
+    }
+
+    .video-card:hover .video-thumbnail::after {
+        content: "Click to watch on YouTube";
+        position: absolute;
+        bottom: 0;
+        left: 0;
+        right: 0;
+        background: rgba(0, 0, 0, 0.8);
+        color: white;
+        padding: 8px;
+        font-size: 0.9rem;
+        font-weight: 600;
+        text-align: center;
+        border-radius: 0 0 8px 8px;
+        z-index: 10;
+    }
+
+    .clickable-card {
+        cursor: pointer !important;
+    }
+
+    .clickable-card:hover {
+        cursor: pointer !important;
+    }
+
+    /* Print-specific styles to maintain dark theme */
+    @media print {
+        * {
+            -webkit-print-color-adjust: exact !important;
+            color-adjust: exact !important;
+            print-color-adjust: exact !important;
+        }
+
+        body, .stApp {
+            background-color: #1A1A1A !important;
+            color: #FFFFFF !important;
+        }
+
+        .video-card {
+            background: linear-gradient(135deg, #2D2D2D 0%, #3A3A3A 100%) !important;
+            border: 1px solid #404040 !important;
+            -webkit-print-color-adjust: exact !important;
+        }
+
+        /* Ensure all backgrounds print correctly */
+        div[style*="background"] {
+            -webkit-print-color-adjust: exact !important;
+            color-adjust: exact !important;
+        }
+
+        /* Force sidebar colors */
+        .css-1d391kg, .css-1y0tads {
+            background-color: #1A1A1A !important;
+        }
+
+        /* Force metric card backgrounds */
+        div[style*="rgba(45, 45, 45"] {
+            background-color: rgba(45, 45, 45, 0.8) !important;
+            -webkit-print-color-adjust: exact !important;
+        }
+
+        /* Chart containers */
+        div[style*="border: 1px solid #404040"] {
+            background-color: rgba(45, 45, 45, 0.8) !important;
+            border: 1px solid #404040 !important;
+            -webkit-print-color-adjust: exact !important;
+        }
+    }
+
+    .pagination-container {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        gap: 1rem;
+        margin: 2rem 0;
+        padding: 1rem;
+    }
+
+    .page-info {
+        color: #CCCCCC;
+        font-size: 0.9rem;
+        margin: 0 1rem;
+    }
+    </style>
+""").strip()
+
+# Video gallery sort options: (column, ascending)
+VIDEO_SORT_OPTIONS = {
+    "Upload Date (Newest)": ('Upload Date', False),
+    "Upload Date (Oldest)": ('Upload Date', True),
+    "Channel Name": ('Channel', True),
+    "Title A-Z": ('Title', True),
+}
+
+@st.cache_data(ttl="15m", max_entries=8, show_spinner=False)
+def sorted_positions(sort_key, ascending):
+    """Row positions that order a column (missing values last); cached on its contents"""
+    return sort_key.reset_index(drop=True).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+
 def show_videos_page():
     """Enhanced Videos page with professional video management interface"""
     st.markdown('<h1 class="page-title">📹 Videos</h1>', unsafe_allow_html=True)
     st.markdown('<p class="page-subtitle">Comprehensive video tracking and performance analysis</p>', unsafe_allow_html=True)
     
     # Load data
-    videos_df, comments_df = load_reputation_data()
+    videos_df, comments_df = get_reputation_data()
     
     if videos_df.empty:
         st.error("⚠️ No video data available. Please check data files.")
@@ -2574,17 +3076,13 @@ def show_videos_page():
         st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📈 Upload Timeline</h3>', unsafe_allow_html=True)
         
         if 'Upload Date' in videos_df.columns:
-            # Create upload timeline chart
-            videos_df_copy = videos_df.copy()
-            videos_df_copy['Upload Date'] = pd.to_datetime(videos_df_copy['Upload Date'])
-            videos_df_copy['Month'] = videos_df_copy['Upload Date'].dt.to_period('M')
-            
-            monthly_uploads = videos_df_copy.groupby('Month').size()
+            # Create upload timeline chart ('Upload Date' is parsed at load)
+            months, monthly_uploads = monthly_upload_counts(videos_df['Upload Date'].to_numpy(dtype='datetime64[ns]'))
             
             fig = go.Figure()
             fig.add_trace(go.Scatter(
-                x=[str(m) for m in monthly_uploads.index],
-                y=monthly_uploads.values,
+                x=months,
+                y=monthly_uploads,
                 mode='lines+markers',
                 line=dict(color='#FF6348', width=3),
                 marker=dict(size=8, color='#FF6348'),
@@ -2657,32 +3155,30 @@ def show_videos_page():
     with col3:
         sort_option = st.selectbox(
             "📊 Sort by",
-            ["Upload Date (Newest)", "Upload Date (Oldest)", "Channel Name", "Title A-Z"]
+            list(VIDEO_SORT_OPTIONS)
         )
     
-    # Apply filters
-    filtered_videos = videos_df.copy()
+    # Apply filters - one boolean mask over the full frame, no filtered copies
+    keep = np.ones(len(videos_df), dtype=bool)
     
     if search_query:
-        mask = filtered_videos['Title'].str.contains(search_query, case=False, na=False)
-        if 'Channel' in filtered_videos.columns:
-            mask |= filtered_videos['Channel'].str.contains(search_query, case=False, na=False)
-        filtered_videos = filtered_videos[mask]
-    
-    if channel_filter != "All Channels" and 'Channel' in filtered_videos.columns:
-        filtered_videos = filtered_videos[filtered_videos['Channel'] == channel_filter]
+        # Plain substring match - no regex engine, and user input like "(" can't break it
+        mask = videos_df['Title'].str.contains(search_query, case=False, regex=False, na=False)
+        if 'Channel' in videos_df.columns:
+            mask |= videos_df['Channel'].str.contains(search_query, case=False, regex=False, na=False)
+        keep &= mask.to_numpy()
     
-    # Apply sorting
-    if 'Upload Date' in filtered_videos.columns:
-        if sort_option == "Upload Date (Newest)":
-            filtered_videos = filtered_videos.sort_values('Upload Date', ascending=False)
-        elif sort_option == "Upload Date (Oldest)":
-            filtered_videos = filtered_videos.sort_values('Upload Date', ascending=True)
+    if channel_filter != "All Channels" and 'Channel' in videos_df.columns:
+        keep &= (videos_df['Channel'] == channel_filter).to_numpy()
     
-    if sort_option == "Channel Name" and 'Channel' in filtered_videos.columns:
-        filtered_videos = filtered_videos.sort_values('Channel')
-    elif sort_option == "Title A-Z":
-        filtered_videos = filtered_videos.sort_values('Title')
+    # Apply sorting - the full frame's order is cached per sort option,
+    # filtering just drops positions from it and the page slices what it shows
+    sort_column, ascending = VIDEO_SORT_OPTIONS[sort_option]
+    if sort_column in videos_df.columns:
+        gallery_positions = sorted_positions(videos_df[sort_column], ascending)
+    else:
+        gallery_positions = np.arange(len(videos_df))
+    gallery_positions = gallery_positions[keep[gallery_positions]]
     
     # Professional spacing
     st.markdown("<div style='margin: 1.5rem 0;'></div>", unsafe_allow_html=True)
@@ -2690,9 +3186,9 @@ def show_videos_page():
     # 📹 VIDEO GRID DISPLAY
     st.markdown('<h2 style="color: #FFF; font-size: 1.4rem; margin-bottom: 1.4rem; font-weight: 600;">📹 Video Gallery</h2>', unsafe_allow_html=True)
     
-    if not filtered_videos.empty:
+    if len(gallery_positions):
         # Display results count
-        st.markdown(f'<p style="color: #999; margin-bottom: 1rem;">Showing {len(filtered_videos)} videos</p>', unsafe_allow_html=True)
+        st.markdown(f'<p style="color: #999; margin-bottom: 1rem;">Showing {len(gallery_positions)} videos</p>', unsafe_allow_html=True)
         
         # Initialize pagination state (0-indexed internally, but displayed as 1-indexed)
         if 'video_page' not in st.session_state:
@@ -2704,296 +3200,77 @@ def show_videos_page():
         
         # Calculate pagination
         videos_per_page = 12
-        total_videos = len(filtered_videos)
+        total_videos = len(gallery_positions)
         total_pages = (total_videos + videos_per_page - 1) // videos_per_page
         
         # Get current page videos
         start_idx = st.session_state.video_page * videos_per_page
         end_idx = start_idx + videos_per_page
-        videos_to_show = filtered_videos.iloc[start_idx:end_idx]
+        videos_to_show = videos_df.iloc[gallery_positions[start_idx:end_idx]]
         
         # Custom CSS for video cards
-        st.markdown("""
-        <style>
-        .video-card {
-            background: linear-gradient(135deg, #2D2D2D 0%, #3A3A3A 100%);
-            border-radius: 12px;
-            padding: 1rem;
-            border: 1px solid #404040;
-            transition: all 0.3s ease;
-            height: 100%;
-            display: flex;
-            flex-direction: column;
-        }
+        st.markdown(_VIDEO_CARD_CSS, unsafe_allow_html=True)
         
-        .video-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 8px 25px rgba(255, 71, 87, 0.25);
-            border-color: #FF4757;
-            cursor: pointer !important;
-            background: linear-gradient(135deg, #3A3A3A 0%, #404040 100%);
-        }
-        
-        .video-thumbnail {
-            width: 100%;
-            height: 180px;
-            background: linear-gradient(45deg, #FF4757, #FF6348);
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-bottom: 1rem;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .video-thumbnail img {
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-            border-radius: 8px;
-        }
-        
-        .video-title {
-            color: white;
-            font-size: 1rem;
-            font-weight: 600;
-            line-height: 1.4;
-            margin-bottom: 0.5rem;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-            flex-grow: 1;
-        }
-        
-        .video-channel {
-            color: #999;
-            font-size: 0.85rem;
-            margin-bottom: 0.75rem;
-        }
-        
-        .video-stats {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            font-size: 0.75rem;
-            color: #CCCCCC;
-            margin-top: auto;
-            padding-top: 0.5rem;
-            border-top: 1px solid #404040;
-        }
-        
-        .video-stat {
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }
-        
-        .video-date {
-            color: #999;
-            font-size: 0.7rem;
-        }
-        
-        .video-card:hover .video-thumbnail::after {
-            content: "Click to watch on YouTube";
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            background: rgba(0, 0, 0, 0.8);
-            color: white;
-            padding: 8px;
-            font-size: 0.9rem;
-            font-weight: 600;
-            text-align: center;
-            border-radius: 0 0 8px 8px;
-            z-index: 10;
-        }
-        
-        .clickable-card {
-            cursor: pointer !important;
-        }
-        
-        .clickable-card:hover {
-            cursor: pointer !important;
-        }
-        
-        /* Print-specific styles to maintain dark theme */
-        @media print {
-            * {
-                -webkit-print-color-adjust: exact !important;
-                color-adjust: exact !important;
-                print-color-adjust: exact !important;
-            }
-            
-            body, .stApp {
-                background-color: #1A1A1A !important;
-                color: #FFFFFF !important;
-            }
-            
-            .video-card {
-                background: linear-gradient(135deg, #2D2D2D 0%, #3A3A3A 100%) !important;
-                border: 1px solid #404040 !important;
-                -webkit-print-color-adjust: exact !important;
-            }
-            
-            /* Ensure all backgrounds print correctly */
-            div[style*="background"] {
-                -webkit-print-color-adjust: exact !important;
-                color-adjust: exact !important;
-            }
-            
-            /* Force sidebar colors */
-            .css-1d391kg, .css-1y0tads {
-                background-color: #1A1A1A !important;
-            }
-            
-            /* Force metric card backgrounds */
-            div[style*="rgba(45, 45, 45"] {
-                background-color: rgba(45, 45, 45, 0.8) !important;
-                -webkit-print-color-adjust: exact !important;
-            }
-            
-            /* Chart containers */
-            div[style*="border: 1px solid #404040"] {
-                background-color: rgba(45, 45, 45, 0.8) !important;
-                border: 1px solid #404040 !important;
-                -webkit-print-color-adjust: exact !important;
-            }
-        }
-        
-        .pagination-container {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: 1rem;
-            margin: 2rem 0;
-            padding: 1rem;
-        }
-        
-        .page-info {
-            color: #CCCCCC;
-            font-size: 0.9rem;
-            margin: 0 1rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        # Create video grid (3 columns)
+        # Video grid (3 columns) - every card in one HTML grid, one markdown call
         cols_per_row = 3
-        rows = len(videos_to_show) // cols_per_row + (1 if len(videos_to_show) % cols_per_row > 0 else 0)
-        
-        for row in range(rows):
-            cols = st.columns(cols_per_row)
-            for col_idx in range(cols_per_row):
-                video_idx = row * cols_per_row + col_idx
-                if video_idx < len(videos_to_show):
-                    video = videos_to_show.iloc[video_idx]
-                    
-                    with cols[col_idx]:
-                        # Extract thumbnail URL from YouTube URL if possible
-                        video_url = video.get('URL', '')
-                        thumbnail_url = ""
-                        if 'youtube.com/watch?v=' in video_url:
-                            video_id = video_url.split('v=')[1].split('&')[0]
-                            thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                        elif 'youtu.be/' in video_url:
-                            video_id = video_url.split('youtu.be/')[1].split('?')[0]
-                            thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                        
-                        # Format title and channel
-                        title = video.get('Title', 'No Title')[:60] + ('...' if len(video.get('Title', '')) > 60 else '')
-                        channel = video.get('Channel', 'Unknown Channel')
-                        upload_date = video.get('Upload Date', 'Unknown')
-                        
-                        # Format date - handle relative dates like "1 day ago", "4 days ago"
-                        upload_date_str = str(upload_date).strip()
-                        formatted_date = upload_date_str  # Start with original string for debugging
-                        
-                        if upload_date_str and upload_date_str != 'Unknown' and upload_date_str != 'nan':
-                            try:
-                                # Handle relative dates
-                                upload_str = upload_date_str.lower()
-                                import re
-                                
-                                # Extract numbers from string
-                                numbers = re.findall(r'\d+', upload_str)
-                                
-                                if numbers and len(numbers) > 0:
-                                    num = int(numbers[0])
-                                    
-                                    if 'day ago' in upload_str:
-                                        date_obj = datetime.now() - timedelta(days=num)
-                                        formatted_date = date_obj.strftime('%b %d, %Y')
-                                    elif 'week ago' in upload_str:
-                                        date_obj = datetime.now() - timedelta(weeks=num)
-                                        formatted_date = date_obj.strftime('%b %d, %Y')
-                                    elif 'month ago' in upload_str:
-                                        date_obj = datetime.now() - timedelta(days=num*30)
-                                        formatted_date = date_obj.strftime('%b %d, %Y')
-                                    elif 'year ago' in upload_str:
-                                        date_obj = datetime.now() - timedelta(days=num*365)
-                                        formatted_date = date_obj.strftime('%b %d, %Y')
-                                    elif 'streamed' in upload_str and 'day' in upload_str:
-                                        date_obj = datetime.now() - timedelta(days=num)
-                                        formatted_date = date_obj.strftime('%b %d, %Y')
-                                elif 'minute' in upload_str or 'hour' in upload_str:
-                                    # Very recent uploads
-                                    formatted_date = datetime.now().strftime('%b %d, %Y')
-                                elif 'streamed' in upload_str:
-                                    # Live stream without specific time
-                                    formatted_date = datetime.now().strftime('%b %d, %Y')
-                            except Exception as e:
-                                # Keep original for debugging
-                                formatted_date = upload_date_str
-                        
-                        # Generate random-ish view and comment counts for demo
-                        # In real implementation, these would come from actual data
-                        import hashlib
-                        hash_input = f"{title}{channel}".encode()
-                        hash_val = int(hashlib.md5(hash_input).hexdigest()[:6], 16)
-                        views = (hash_val % 50000) + 1000
-                        comments = (hash_val % 500) + 10
-                        
-                        # Create thumbnail HTML separately to avoid f-string backslash issues
-                        thumbnail_html = ""
-                        if thumbnail_url:
-                            thumbnail_html = f'<img src="{thumbnail_url}" alt="Video Thumbnail" onerror="this.style.display=&quot;none&quot;">'
-                        
-                        # Create clickable video card using Streamlit link_button approach
-                        video_link = video.get('URL', '#')
-                        
-                        # Create video card as a clickable HTML link
-                        card_html = f"""
-                        <a href="{video_link}" target="_blank" style="text-decoration: none; color: inherit;">
-                            <div class="video-card clickable-card">
-                                <div class="video-thumbnail">
-                                    {thumbnail_html}
-                                </div>
-                                <div class="video-title">{title}</div>
-                                <div class="video-channel">{channel}</div>
-                                <div class="video-stats">
-                                    <div class="video-stat">
-                                        <span>👁️</span>
-                                        <span>{views:,} views</span>
-                                    </div>
-                                    <div class="video-stat">
-                                        <span>💬</span>
-                                        <span>{comments}</span>
-                                    </div>
-                                </div>
-                                <div class="video-date">{formatted_date}</div>
-                            </div>
-                        </a>
-                        """
-                        
-                        # Display the clickable card
-                        st.markdown(card_html, unsafe_allow_html=True)
-                        
-                        # Add some spacing between rows
-                        if video_idx < len(videos_to_show) - 1 and (video_idx + 1) % cols_per_row == 0:
-                            st.markdown("<br>", unsafe_allow_html=True)
+        card_parts = []
+        
+        for _, video in videos_to_show.iterrows():
+            # Thumbnail from the YouTube ID extracted at load (NaN when the URL has none)
+            video_id = video.get('YouTubeID')
+            thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg" if isinstance(video_id, str) else ""
+            
+            # Format title and channel
+            title = video.get('Title', 'No Title')[:60] + ('...' if len(video.get('Title', '')) > 60 else '')
+            channel = video.get('Channel', 'Unknown Channel')
+            upload_date = video.get('Upload Date', 'Unknown')
+            
+            # Relative dates ("1 day ago") were parsed into UploadAge at load
+            upload_age = video.get('UploadAge', pd.NaT)
+            if pd.notna(upload_age):
+                formatted_date = (datetime.now() - upload_age).strftime('%b %d, %Y')
+            else:
+                formatted_date = str(upload_date).strip()
+            
+            # Random-ish demo view and comment counts, precomputed at load
+            # In real implementation, these would come from actual data
+            views = video['DemoViews']
+            comments = video['DemoComments']
+            
+            # Create thumbnail HTML separately to avoid f-string backslash issues
+            thumbnail_html = ""
+            if thumbnail_url:
+                thumbnail_html = f'<img src="{thumbnail_url}" alt="Video Thumbnail" onerror="this.style.display=&quot;none&quot;">'
+            
+            # Create clickable video card using Streamlit link_button approach
+            video_link = video.get('URL', '#')
+            
+            # Create video card as a clickable HTML link
+            card_parts.append(f"""
+            <a href="{video_link}" target="_blank" style="text-decoration: none; color: inherit;">
+                <div class="video-card clickable-card">
+                    <div class="video-thumbnail">{thumbnail_html}</div>
+                    <div class="video-title">{title}</div>
+                    <div class="video-channel">{channel}</div>
+                    <div class="video-stats">
+                        <div class="video-stat">
+                            <span>👁️</span>
+                            <span>{views:,} views</span>
+                        </div>
+                        <div class="video-stat">
+                            <span>💬</span>
+                            <span>{comments}</span>
+                        </div>
+                    </div>
+                    <div class="video-date">{formatted_date}</div>
+                </div>
+            </a>
+            """.strip())
+        
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: repeat({cols_per_row}, 1fr); gap: 1.5rem 1rem;">{"".join(card_parts)}</div>',
+            unsafe_allow_html=True
+        )
         
         # Pagination Navigation
         if total_pages > 1:
@@ -3067,7 +3344,7 @@ def show_comments_page():
     st.markdown('<h1 class="page-title">💬 Comments</h1>', unsafe_allow_html=True)
     st.markdown('<p class="page-subtitle">Deep dive into public comments and discussions about Sridhar Rao</p>', unsafe_allow_html=True)
     
-    videos_df, comments_df_raw = load_reputation_data()
+    videos_df, comments_df_raw = get_reputation_data()
     
     # Apply language preference to comments
     comments_df = get_language_aware_comments(comments_df_raw)
@@ -3152,7 +3429,7 @@ def show_comments_page():
     
     with col4:
         positive_pct = round((sentiment_dist['Positive'] / total_comments) * 100, 1) if total_comments > 0 else 0
-        pct_color = "#22C55E" if positive_pct >= 50 else "#FFA502" if positive_pct >= 30 else "#EF4444"
+        pct_color = tri_color(positive_pct, 30, 50)
         
         st.markdown(f"""
         <div style="{card_style}" 
@@ -3177,18 +3454,14 @@ def show_comments_page():
         st.markdown('<h3 style="color: #FF4757; font-size: 1.1rem; margin: 0 0 1rem 0; font-weight: 600;">📈 Sentiment Timeline</h3>', unsafe_allow_html=True)
         
         if 'Date' in comments_df.columns and 'Sentiment' in comments_df.columns:
-            # Create sentiment timeline chart
-            comments_df_copy = comments_df.copy()
-            comments_df_copy['Date'] = pd.to_datetime(comments_df_copy['Date'])
-            
-            # Group by date and calculate daily sentiment
-            daily_sentiment = comments_df_copy.groupby(comments_df_copy['Date'].dt.date)['Sentiment'].mean().reset_index()
-            daily_sentiment['Date'] = pd.to_datetime(daily_sentiment['Date'])
+            # Group by the calendar day parsed once at load - no copy, no per-row date objects
+            daily_sentiment = comments_df.groupby('DateOnly')['Sentiment'].mean().rename_axis('Date').reset_index()
             
             fig = go.Figure()
             
             # Use dynamic color based on sentiment value
-            sentiment_colors = ['#EF4444' if s < -0.1 else '#22C55E' if s > 0.1 else '#FFA502' for s in daily_sentiment['Sentiment']]
+            daily_means = daily_sentiment['Sentiment'].to_numpy()
+            sentiment_colors = np.select([daily_means < -0.1, daily_means > 0.1], ['#EF4444', '#22C55E'], default='#FFA502')
             
             fig.add_trace(go.Scatter(
                 x=daily_sentiment['Date'],
@@ -3463,7 +3736,7 @@ def show_data_intelligence_page():
     load_custom_css()
     
     # Load data with language preference support
-    videos_df, comments_df_raw = load_reputation_data()
+    videos_df, comments_df_raw = get_reputation_data()
     
     # Apply language preference to comments
     comments_df = get_language_aware_comments(comments_df_raw)
@@ -3588,14 +3861,12 @@ def show_data_intelligence_page():
         if not videos_filtered.empty or not comments_filtered.empty:
             # Create daily activity data
             date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-            daily_data = []
             
-            for date in date_range:
-                day_videos = len(videos_filtered[videos_filtered['Upload Date'].dt.date == date.date()]) if not videos_filtered.empty else 0
-                day_comments = len(comments_filtered[comments_filtered['Date'].dt.date == date.date()]) if not comments_filtered.empty else 0
-                daily_data.append({'Date': date, 'Videos': day_videos, 'Comments': day_comments})
+            # Count each frame per calendar day once, then line the counts up with the range
+            day_videos = videos_filtered['Upload Date'].dt.normalize().value_counts().reindex(date_range, fill_value=0).to_numpy() if not videos_filtered.empty else 0
+            day_comments = comments_filtered['DateOnly'].value_counts().reindex(date_range, fill_value=0).to_numpy() if not comments_filtered.empty else 0
             
-            daily_df = pd.DataFrame(daily_data)
+            daily_df = pd.DataFrame({'Date': date_range, 'Videos': day_videos, 'Comments': day_comments})
             
             fig_activity = go.Figure()
             
@@ -3660,13 +3931,13 @@ def show_data_intelligence_page():
         st.markdown("### 📈 Sentiment Trend Analysis")
         
         # Group by date for sentiment trend
-        daily_sentiment = comments_filtered.groupby(comments_filtered['Date'].dt.date)['Sentiment'].agg(['mean', 'count']).reset_index()
-        daily_sentiment['Date'] = pd.to_datetime(daily_sentiment['Date'])
+        daily_sentiment = comments_filtered.groupby('DateOnly')['Sentiment'].agg(['mean', 'count']).rename_axis('Date').reset_index()
         
         fig_sentiment = go.Figure()
         
         # Sentiment line
-        sentiment_colors = ['#EF4444' if s < -0.1 else '#22C55E' if s > 0.1 else '#FFA502' for s in daily_sentiment['mean']]
+        daily_means = daily_sentiment['mean'].to_numpy()
+        sentiment_colors = np.select([daily_means < -0.1, daily_means > 0.1], ['#EF4444', '#22C55E'], default='#FFA502')
         
         fig_sentiment.add_trace(go.Scatter(
             x=daily_sentiment['Date'],
@@ -3760,8 +4031,9 @@ def show_data_intelligence_page():
                 """
                 st.markdown(html_table, unsafe_allow_html=True)
             else:
-                st.dataframe(
+                display_df_fast(
                     videos_show[['Title', 'Channel', 'Upload Date']],
+                    key="intel_videos_table",
                     use_container_width=True,
                     hide_index=True
                 )
@@ -3803,11 +4075,12 @@ def show_data_intelligence_page():
             
             comments_show['Sentiment_Badge'] = comments_show.apply(get_sentiment_badge, axis=1)
             
-            st.dataframe(
+            display_df_fast(
                 comments_show[['Author', 'Comment_Short', 'Sentiment_Badge', 'Date']].rename(columns={
                     'Comment_Short': 'Comment',
                     'Sentiment_Badge': 'Sentiment'
                 }),
+                key="intel_comments_table",
                 use_container_width=True,
                 hide_index=True
             )
@@ -3940,7 +4213,7 @@ def show_settings_page():
         """, unsafe_allow_html=True)
         
         # Load data for system info
-        videos_df, comments_df = load_reputation_data()
+        videos_df, comments_df = get_reputation_data()
         
         # Data status indicators
         if not videos_df.empty:
@@ -4012,7 +4285,7 @@ def show_settings_page():
         """, unsafe_allow_html=True)
         
         # Load data for export
-        videos_df, comments_df = load_reputation_data()
+        videos_df, comments_df = get_reputation_data()
         
         col1, col2 = st.columns(2)
         
@@ -4050,7 +4323,7 @@ def show_executive_reports_page():
     st.markdown('<p class="page-subtitle">Automated intelligence briefings and executive-level analytics</p>', unsafe_allow_html=True)
     
     # Load data and initialize reporting engine
-    videos_df, comments_df = load_reputation_data()
+    videos_df, comments_df = get_reputation_data()
     
     if videos_df.empty or comments_df.empty:
         st.error("⚠️ Unable to load data for executive reporting")
@@ -4058,8 +4331,8 @@ def show_executive_reports_page():
     
     try:
         # Initialize engines
-        reporting_engine = ExecutiveReportingEngine()
-        crisis_engine = CrisisDetectionEngine()
+        reporting_engine = get_reporting_engine()
+        crisis_engine = get_crisis_engine()
         
         # Get crisis data for comprehensive reporting
         crisis_status = crisis_engine.get_crisis_status(videos_df, comments_df)
@@ -4326,7 +4599,7 @@ def show_reputation_alerts_page():
     st.markdown('<p class="page-subtitle">Real-time sentiment escalation monitoring and brand reputation management</p>', unsafe_allow_html=True)
     
     # Load data and initialize reputation monitoring with language preference support
-    videos_df, comments_df_raw = load_reputation_data()
+    videos_df, comments_df_raw = get_reputation_data()
     
     # Apply language preference to comments
     comments_df = get_language_aware_comments(comments_df_raw)
@@ -583,6 +583,9 @@ class Phase2BCommentsAIProcessor:
         # Save enhanced dataset
         enhanced_df.to_csv(output_file, index=False)
         
+        # Pre-aggregate daily sentiment for the dashboard timeline
+        self._save_daily_sentiment(enhanced_df, output_file)
+        
         # Generate comprehensive report
         self._generate_processing_report(enhanced_df, output_file)
         
@@ -591,6 +594,32 @@ class Phase2BCommentsAIProcessor:
         
         return enhanced_df
     
+    def _save_daily_sentiment(self, df: pd.DataFrame, output_file: str):
+        """Write per-day mean English sentiment as a Parquet feature table next to the dataset"""
+        daily_file = Path(output_file).parent / 'sentiment_daily.parquet'
+        
+        if 'Date_Formatted' not in df.columns or 'SentimentScore_EN' not in df.columns:
+            return
+        
+        # Same parsing and cleaning the dashboard applies on load
+        daily = pd.DataFrame({
+            'Date': pd.to_datetime(df['Date_Formatted'], format='%d-%m-%Y', errors='coerce', cache=True),
+            'Sentiment': pd.to_numeric(df['SentimentScore_EN'], errors='coerce').astype('float32')
+        }).dropna()
+        daily = (
+            daily.groupby(daily['Date'].dt.normalize())['Sentiment']
+            .agg(['mean', 'size'])
+            .rename(columns={'mean': 'Sentiment', 'size': 'Count'})
+            .reset_index()
+        )
+        
+        try:
+            daily.to_parquet(daily_file, engine='pyarrow', compression='zstd', index=False)
+            logger.info(f"📅 Daily sentiment table saved: {daily_file} ({len(daily)} days)")
+        except (ImportError, OSError) as e:
+            # The dashboard falls back to aggregating the CSV itself
+            logger.warning(f"⚠️ Could not write daily sentiment table: {e}")
+    
     def _calculate_reply_counts(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate reply counts for comments"""
         reply_counts = df.groupby('ParentID').size().to_dict()